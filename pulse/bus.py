@@ -0,0 +1,96 @@
+class MetricBus:
+    """Deliver metric values from collectors to the widgets showing them.
+
+    Widgets subscribe a callback to a metric name; publishers call publish()
+    and the value is dropped right away when nobody is subscribed, so a
+    metric costs nothing while no page shows it. Values published in the
+    same frame are delivered together from a single root.after callback,
+    with only the newest value of each metric. publish() must be called on
+    the Tk thread, as PageLoader and RefreshScheduler callbacks are.
+    """
+
+    def __init__(self, root, frame_ms=16):
+        self.root = root
+        self.frame_ms = frame_ms
+        self._subscribers = {}  # metric -> [callback]
+        self._pending = {}
+        self._timer = None
+        self._demand_listeners = []
+
+    def add_demand_listener(self, callback):
+        """Call callback(metric, wanted) when a metric gets its first subscriber or loses its last"""
+        self._demand_listeners.append(callback)
+
+    def subscribe(self, metric, callback):
+        callbacks = self._subscribers.setdefault(metric, [])
+        callbacks.append(callback)
+        if len(callbacks) == 1:
+            self._demand_changed(metric, True)
+
+    def unsubscribe(self, metric, callback):
+        callbacks = self._subscribers.get(metric)
+        if not callbacks or callback not in callbacks:
+            return
+        callbacks.remove(callback)
+        if not callbacks:
+            del self._subscribers[metric]
+            self._pending.pop(metric, None)
+            self._demand_changed(metric, False)
+
+    def attach(self, subscriptions):
+        """Subscribe a list of (metric, callback) pairs, e.g. those of a page being shown"""
+        for metric, callback in subscriptions:
+            self.subscribe(metric, callback)
+
+    def detach(self, subscriptions):
+        for metric, callback in subscriptions:
+            self.unsubscribe(metric, callback)
+
+    def wants(self, metric):
+        return metric in self._subscribers
+
+    def wants_any(self, prefix):
+        """Whether any metric starting with prefix, e.g. a 'nic_io:' family, has subscribers"""
+        return any(metric.startswith(prefix) for metric in self._subscribers)
+
+    def has_subscribers(self):
+        return bool(self._subscribers)
+
+    def publish(self, metric, value):
+        """Queue a value for the next frame; returns False if nobody wants it.
+
+        A None value means there is no reading yet and is not delivered.
+        """
+        if value is None or metric not in self._subscribers:
+            return False
+        self._pending[metric] = value
+        if self._timer is None:
+            self._timer = self.root.after(self.frame_ms, self._flush)
+        return True
+
+    def stop(self):
+        if self._timer is not None:
+            try:
+                self.root.after_cancel(self._timer)
+            except Exception:
+                pass
+            self._timer = None
+        self._pending.clear()
+
+    def _flush(self):
+        self._timer = None
+        pending, self._pending = self._pending, {}
+        for metric, value in pending.items():
+            # A callback may unsubscribe others, e.g. by switching pages
+            for callback in list(self._subscribers.get(metric, ())):
+                try:
+                    callback(value)
+                except Exception as e:
+                    print(f"Error updating {metric}:", e)
+
+    def _demand_changed(self, metric, wanted):
+        for listener in self._demand_listeners:
+            try:
+                listener(metric, wanted)
+            except Exception as e:
+                print("Metric demand listener error:", e)
@@ -0,0 +1,95 @@
+import json
+import os
+import sys
+import threading
+import time
+
+
+class TTLCache:
+    """Cache collector results by key, each key with its own time-to-live.
+
+    Values are produced by calling the loader passed to get(); concurrent
+    callers asking for the same stale key wait for a single load instead of
+    all querying the system. With a path the cache is mirrored to a JSON file,
+    so a restart can reuse inventory that is still within its TTL.
+    """
+
+    def __init__(self, ttls=None, default_ttl=300, path=None):
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.path = path
+        self._entries = {}  # key -> (stored_at, value)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._save_lock = threading.Lock()
+        if path:
+            self._load()
+
+    def ttl(self, key):
+        return self.ttls.get(key, self.default_ttl)
+
+    def get(self, key, loader):
+        """Return the cached value for key, calling loader() when it is missing or expired"""
+        value = self._fresh(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have filled it while we waited
+            value = self._fresh(key)
+            if value is not None:
+                return value
+            value = loader()
+            self.put(key, value)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+        if self.path:
+            self._save()
+
+    def invalidate(self, key=None):
+        """Drop one key, or every key when none is given"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+        if self.path:
+            self._save()
+
+    def _fresh(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.time() - stored_at > self.ttl(key):
+            return None
+        return value
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for key, entry in data.items():
+                self._entries[key] = (float(entry["time"]), entry["value"])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print("Ignoring unreadable cache file:", e, file=sys.stderr)
+
+    def _save(self):
+        with self._lock:
+            data = {key: {"time": stored_at, "value": value}
+                    for key, (stored_at, value) in self._entries.items()}
+        tmp_path = f"{self.path}.tmp"
+        with self._save_lock:
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print("Could not write cache file:", e, file=sys.stderr)
@@ -0,0 +1,835 @@
+import platform
+import re
+import socket
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import psutil
+
+from .cache import TTLCache
+from .gpus import GPUMonitor, bus_id_from_location, default_gpu_sources, match_gpus, pci_id_from_pnp
+from .history import History
+from .journal import JournalWriter, pack_record
+from .processes import ProcessScanner
+from .sampler import Sampler
+from .sensors import SysfsSensors, TemperatureProbe, default_sources
+from .storage import DiskUsageProbe, partition_key, sysfs_disks, sysfs_partition_index, wmi_reference_id
+from .wmi_service import WMIService
+
+
+# Seconds each cached inventory collector stays valid
+CACHE_TTLS = {
+    'os_record': 3600,
+    'os': 3600,
+    'cpu': 3600,
+    'ram_modules': 3600,
+    'motherboard': 3600,
+    'video_controllers': 600,
+    'disk_drives': 600,
+    'partition_index': 600,
+    'optical': 600,
+    'audio': 600,
+    'network_adapters': 300,
+    'peripherals': 120,
+}
+
+PROCESSOR_FIELDS = ["Name", "Manufacturer", "Architecture", "NumberOfCores", "NumberOfLogicalProcessors",
+                    "MaxClockSpeed", "CurrentClockSpeed", "L2CacheSize", "L3CacheSize", "ProcessorId",
+                    "SocketDesignation", "CurrentVoltage"]
+
+# Win32_Processor.Architecture values
+ARCHITECTURE_NAMES = {
+    0: "x86",
+    1: "MIPS",
+    2: "Alpha",
+    3: "PowerPC",
+    5: "ARM",
+    6: "ia64",
+    9: "x64",
+    12: "ARM64"
+}
+
+OS_RECORD_FIELDS = ["Caption", "Version", "BuildNumber", "Manufacturer", "RegisteredUser",
+                    "SystemDirectory", "WindowsDirectory"]
+
+
+# Seconds between refreshes of the GPU and temperature readings stored in the journal
+JOURNAL_SLOW_PERIOD = 5.0
+
+# Collector behind each inventory section, in sidebar order
+SECTIONS = {
+    'summary': 'get_system_summary',
+    'os': 'get_os_info',
+    'cpu': 'get_cpu_info',
+    'ram': 'get_ram_info',
+    'motherboard': 'get_motherboard_info',
+    'graphics': 'get_graphics_info',
+    'storage': 'get_storage_info',
+    'optical': 'get_optical_drives_info',
+    'audio': 'get_audio_info',
+    'peripherals': 'get_peripherals_info',
+    'network': 'get_network_info',
+}
+
+
+def partition_details(partition, usage):
+    return {
+        "File System": partition.fstype,
+        "Total": f"{usage.total / (1024**3):.1f} GB",
+        "Used": f"{usage.used / (1024**3):.1f} GB",
+        "Free": f"{usage.free / (1024**3):.1f} GB",
+        "Usage": f"{(usage.used / usage.total) * 100:.1f}%" if usage.total else "N/A"
+    }
+
+
+def disk_io_name(disk):
+    """Name under which a Storage page entry appears in the per-disk I/O counters"""
+    if disk.get("Device", "Unknown") != "Unknown":
+        return disk["Device"]
+    if disk.get("Drive", "").startswith("/dev/"):
+        return disk["Drive"][len("/dev/"):]
+    return None
+
+
+def gpu_details(gpu):
+    """Display fields of a GPUReading, leaving out what its source does not report"""
+    details = {}
+    if gpu.load is not None:
+        details["GPU Load"] = f"{gpu.load:.1f}%"
+    if gpu.memory_used is not None:
+        total = f"{gpu.memory_total:.0f} MB" if gpu.memory_total else "Unknown"
+        details["Memory Usage"] = f"{gpu.memory_used:.0f} MB / {total}"
+    if gpu.temperature is not None:
+        details["Temperature"] = f"{gpu.temperature:.0f}°C"
+    if gpu.core_clock is not None:
+        details["Core Clock"] = f"{gpu.core_clock:.0f} MHz"
+    if gpu.memory_clock is not None:
+        details["Memory Clock"] = f"{gpu.memory_clock:.0f} MHz"
+    if gpu.power is not None:
+        details["Power"] = f"{gpu.power:.1f} W"
+    return details
+
+
+def gpu_series(key, field):
+    """History series of one GPU field, named by the card's stable key rather than its position"""
+    return f"GPU {key} {field}"
+
+
+def percent_text(value):
+    """Format a sampler percentage, which is None until two readings exist"""
+    return f"{value:.1f}%" if value is not None else "Measuring..."
+
+
+class SystemInfoEngine:
+    """Collects system information without any user interface.
+    
+    Every get_* method returns plain dicts and lists of display strings, so
+    the window, scripts and benchmarks can all share the same collectors.
+    start() begins live sampling and close() releases the sensors.
+    """
+    
+    def __init__(self, cache_file=None, journal_file=None, wmi_service=None, sysfs=None, sample_interval=1.0):
+        # WMI access; the service keeps one COM connection per worker thread
+        self.wmi = wmi_service or WMIService()
+        
+        # The working temperature source is found once and then reused
+        self.sysfs = sysfs or SysfsSensors()
+        self.temperature_probe = TemperatureProbe(default_sources(self.wmi, self.sysfs))
+        
+        # Static inventory is cached per collector
+        self.cache = TTLCache(CACHE_TTLS, path=cache_file)
+        
+        # Live counters are read on a background thread and every reading is
+        # kept in fixed-size history buffers
+        self.sampler = Sampler(interval=sample_interval)
+        self.history = History()
+        self.sampler.add_listener(self.history.record_snapshot)
+        
+        # GPUs are read through a persistent NVML or sysfs session, one read per tick
+        self.gpus = GPUMonitor(default_gpu_sources(), ttl=sample_interval)
+        
+        # Mountpoint usage is queried in parallel so one hung share cannot stall the page
+        self.disk_usage = DiskUsageProbe()
+        
+        # Per-process counters are kept between scans to compute rates
+        self.process_scanner = ProcessScanner()
+        
+        # Optionally every reading is also appended to an on-disk journal. GPU
+        # and temperature reads can be slow, so they are refreshed on a worker
+        # and the sampler thread only journals the last values they produced
+        self.journal = None
+        if journal_file:
+            self.journal = JournalWriter(journal_file)
+            self._journal_readings = ([], None)
+            self._journal_refresh = 0.0
+            self._journal_pending = None
+            self._journal_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pulse-journal")
+            self.sampler.add_listener(self.record_journal)
+    
+    def start(self):
+        self.sampler.start()
+        return self
+    
+    def close(self):
+        self.sampler.stop()
+        if self.journal is not None:
+            # Let a refresh in progress finish before its sensors are closed
+            self._journal_executor.shutdown(wait=True)
+            self.journal.close()
+        self.temperature_probe.close()
+        self.gpus.close()
+        self.sysfs.close()
+        self.disk_usage.shutdown()
+    
+    def record_journal(self, snapshot):
+        """Sampler listener writing each snapshot with the latest GPU loads and hottest temperature"""
+        now = time.monotonic()
+        pending = self._journal_pending
+        if now >= self._journal_refresh and (pending is None or pending.done()):
+            self._journal_refresh = now + JOURNAL_SLOW_PERIOD
+            try:
+                self._journal_pending = self._journal_executor.submit(self.refresh_journal_readings)
+            except RuntimeError:
+                # The engine is closing
+                pass
+        self.journal.append(pack_record(snapshot, *self._journal_readings))
+    
+    def refresh_journal_readings(self):
+        """Read the GPU loads and hottest temperature journaled with the next snapshots"""
+        try:
+            # Ordered by key so a card keeps its journal slot when sources are rediscovered
+            gpu_loads = [gpu.load for gpu in sorted(self.get_gpus(), key=lambda gpu: gpu.key)]
+        except Exception:
+            gpu_loads = []
+        try:
+            temperatures = self.temperature_probe.read()
+        except Exception:
+            temperatures = {}
+        self._journal_readings = (gpu_loads, max(temperatures.values()) if temperatures else None)
+    
+    def snapshot(self):
+        """Latest live reading, taken on demand when the sampler is not running"""
+        return self.sampler.latest() or self.sampler.sample()
+    
+    def inventory(self, sections=None):
+        """Run the collectors of the given sections (all by default) and return {section: data}"""
+        return {name: getattr(self, SECTIONS[name])() for name in sections or SECTIONS}
+    
+    def get_processes(self):
+        """Every running process with CPU and I/O rates since the previous call"""
+        return self.process_scanner.scan()
+    
+    def get_gpus(self):
+        """Live GPUReadings of every GPU, shared by all callers within one tick"""
+        gpus = self.gpus.read()
+        now = time.time()
+        for gpu in gpus:
+            self.history.record(gpu_series(gpu.key, "Load"), now, gpu.load)
+            if gpu.memory_used is not None and gpu.memory_total:
+                self.history.record(gpu_series(gpu.key, "Memory"), now, gpu.memory_used / gpu.memory_total * 100)
+            self.history.record(gpu_series(gpu.key, "Temperature"), now, gpu.temperature)
+        return gpus
+    
+    def get_system_summary(self):
+        uname = platform.uname()
+        snapshot = self.snapshot()
+        memory = snapshot.memory
+        
+        uptime = datetime.now() - datetime.fromtimestamp(snapshot.boot_time or psutil.boot_time())
+        process_count = snapshot.process_count
+        if process_count is None:
+            process_count = len(psutil.pids())
+        try:
+            disk_usage = f"{psutil.disk_usage('/').percent:.1f}%"
+        except Exception:
+            disk_usage = "N/A"
+        
+        # Get proper Windows version
+        os_name = self.get_windows_version()
+        
+        return {
+            "system": {
+                "Computer Name": uname.node,
+                "Operating System": os_name,
+                "Processor": uname.processor or "Unknown",
+                "Total RAM": f"{memory.total / (1024**3):.1f} GB",
+                "Available RAM": f"{memory.available / (1024**3):.1f} GB"
+            },
+            "performance": {
+                "CPU Usage": percent_text(snapshot.cpu_percent),
+                "RAM Usage": f"{memory.percent:.1f}%",
+                "Disk Usage": disk_usage,
+                "Active Processes": process_count,
+                "System Uptime": str(uptime).split('.')[0]
+            }
+        }
+    
+    def get_os_record(self):
+        """Win32_OperatingSystem properties, queried once for every page that needs them"""
+        return self.cache.get('os_record', self.query_os_record)
+    
+    def query_os_record(self):
+        record = {}
+        if self.wmi.available:
+            try:
+                for os_data in self.wmi.query("Win32_OperatingSystem", OS_RECORD_FIELDS):
+                    record = os_data.as_dict()
+                    break
+            except:
+                pass
+        return record
+    
+    def get_windows_version(self):
+        """Get accurate Windows version including Windows 11 detection"""
+        try:
+            # Try to get version from WMI first
+            caption = self.get_os_record().get("Caption")
+            if caption:
+                return caption
+            
+            # Fallback to platform info with Windows 11 detection
+            import sys
+            if sys.platform == "win32":
+                try:
+                    # Check Windows 11 by build number
+                    version_info = platform.version()
+                    if "10.0.22000" in version_info or "10.0.22" in version_info:
+                        return "Microsoft Windows 11"
+                    elif "10.0" in version_info:
+                        return "Microsoft Windows 10"
+                    else:
+                        return f"Microsoft Windows {platform.release()}"
+                except:
+                    return f"{platform.system()} {platform.release()}"
+            else:
+                return f"{platform.system()} {platform.release()}"
+        except:
+            return f"{platform.system()} {platform.release()}"
+    
+    def get_os_info(self):
+        return self.cache.get('os', self.query_os_info)
+    
+    def query_os_info(self):
+        uname = platform.uname()
+        
+        os_info = {
+            "Operating System": self.get_windows_version(),
+            "Version": uname.version,
+            "Architecture": uname.machine,
+            "Computer Name": uname.node,
+            "Processor": uname.processor or "Unknown"
+        }
+        
+        os_data = self.get_os_record()
+        if os_data:
+            os_info.update({
+                "Operating System": os_data["Caption"] or os_info["Operating System"],
+                "Version": os_data["Version"] or os_info["Version"],
+                "Build Number": os_data["BuildNumber"] or "Unknown",
+                "Manufacturer": os_data["Manufacturer"] or "Unknown",
+                "Registered User": os_data["RegisteredUser"] or "Unknown",
+                "System Directory": os_data["SystemDirectory"] or "Unknown",
+                "Windows Directory": os_data["WindowsDirectory"] or "Unknown"
+            })
+        
+        return os_info
+    
+    def get_cpu_info(self, temperatures=None):
+        cpu_info = {
+            "Processor": platform.processor() or "Unknown",
+            "Physical Cores": psutil.cpu_count(logical=False),
+            "Logical Cores": psutil.cpu_count(logical=True),
+            "CPU Usage": percent_text(self.snapshot().cpu_percent)
+        }
+        
+        # Add temperature information
+        if temperatures is None:
+            temperatures = self.get_system_temperatures()
+        if temperatures:
+            for sensor_name, temp_value in temperatures.items():
+                cpu_info[f"Temperature - {sensor_name}"] = temp_value
+        
+        cpu_info.update(self.cache.get('cpu', self.query_processor_info))
+        
+        return cpu_info
+    
+    def query_processor_info(self):
+        processor_info = {}
+        
+        if self.wmi.available:
+            try:
+                for processor in self.wmi.query("Win32_Processor", PROCESSOR_FIELDS):
+                    processor_info.update({
+                        "Processor Name": processor.Name or "Unknown",
+                        "Manufacturer": processor.Manufacturer or "Unknown",
+                        "Architecture": self.get_architecture_name(processor.Architecture) if processor.Architecture is not None else "Unknown",
+                        "Physical Cores": processor.NumberOfCores or psutil.cpu_count(logical=False),
+                        "Logical Cores": processor.NumberOfLogicalProcessors or psutil.cpu_count(logical=True),
+                        "Max Clock Speed": f"{processor.MaxClockSpeed} MHz" if processor.MaxClockSpeed else "Unknown",
+                        "Current Clock Speed": f"{processor.CurrentClockSpeed} MHz" if processor.CurrentClockSpeed else "Unknown",
+                        "L2 Cache Size": f"{processor.L2CacheSize} KB" if processor.L2CacheSize else "Unknown",
+                        "L3 Cache Size": f"{processor.L3CacheSize} KB" if processor.L3CacheSize else "Unknown",
+                        "Processor ID": processor.ProcessorId or "Unknown",
+                        "Socket": processor.SocketDesignation or "Unknown",
+                        "Voltage": f"{processor.CurrentVoltage / 10:.1f}V" if processor.CurrentVoltage else "Unknown"
+                    })
+                    break
+            except:
+                pass
+        
+        return processor_info
+    
+    def get_architecture_name(self, architecture):
+        return ARCHITECTURE_NAMES.get(architecture, f"Unknown ({architecture})")
+    
+    def get_cpu_temperature(self):
+        """Get CPU temperature from whichever sensor source works on this machine"""
+        readings = self.temperature_probe.read()
+        now = time.time()
+        for name, celsius in readings.items():
+            self.history.record(f"Temperature - {name}", now, celsius)
+        return {name: f"{celsius:.1f}°C" for name, celsius in readings.items()}
+    
+    def get_hardware_sensors(self):
+        """Fan, voltage and power readings exposed through sysfs"""
+        if not self.sysfs.available:
+            return {}
+        return {sensor.label: sensor.format(value) for sensor, value in self.sysfs.read(("fan", "in", "power"))}
+    
+    def get_system_temperatures(self):
+        """Get all available temperature sensors"""
+        all_temps = {}
+        
+        # Get CPU temperature
+        cpu_temps = self.get_cpu_temperature()
+        all_temps.update(cpu_temps)
+        
+        # Get GPU temperature (if available)
+        try:
+            gpus = self.get_gpus()
+            for gpu in gpus:
+                if gpu.temperature and gpu.temperature > 0:
+                    # The key keeps rows of identical cards apart
+                    all_temps[f"GPU {gpu.name} ({gpu.key})"] = f"{gpu.temperature:.0f}°C"
+        except:
+            pass
+        
+        return all_temps
+        
+    
+    def get_ram_info(self):
+        memory = self.snapshot().memory
+        
+        ram_info = {
+            "Total RAM": f"{memory.total / (1024**3):.2f} GB",
+            "Available": f"{memory.available / (1024**3):.2f} GB",
+            "Used": f"{memory.used / (1024**3):.2f} GB",
+            "Usage Percentage": f"{memory.percent:.1f}%",
+            "Free": f"{memory.free / (1024**3):.2f} GB"
+        }
+        
+        ram_info.update(self.cache.get('ram_modules', self.query_ram_modules))
+        
+        return ram_info
+    
+    def query_ram_modules(self):
+        modules = {}
+        
+        if self.wmi.available:
+            try:
+                fields = ["DeviceLocator", "Capacity", "Speed", "Manufacturer", "PartNumber", "SerialNumber"]
+                for memory_device in self.wmi.query("Win32_PhysicalMemory", fields):
+                    location = memory_device.DeviceLocator or f"Module {len(modules) + 1}"
+                    modules[f"RAM Module - {location}"] = {
+                        "Capacity": f"{int(memory_device.Capacity) / (1024**3):.0f} GB" if memory_device.Capacity else "Unknown",
+                        "Speed": f"{memory_device.Speed} MHz" if memory_device.Speed else "Unknown",
+                        "Manufacturer": memory_device.Manufacturer or "Unknown",
+                        "Part Number": memory_device.PartNumber or "Unknown",
+                        "Serial Number": memory_device.SerialNumber or "Unknown"
+                    }
+            except:
+                pass
+        
+        return modules
+    
+    def get_motherboard_info(self):
+        return self.cache.get('motherboard', self.query_motherboard_info)
+    
+    def query_motherboard_info(self):
+        motherboard_info = {"Motherboard Info": "Information not available"}
+        
+        if self.wmi.available:
+            try:
+                results = self.wmi.query_many({
+                    "board": ("Win32_BaseBoard", ["Manufacturer", "Product", "SerialNumber", "Version"]),
+                    "bios": ("Win32_BIOS", ["Manufacturer", "SMBIOSBIOSVersion", "ReleaseDate"])
+                })
+                for board in results["board"]:
+                    motherboard_info.update({
+                        "Manufacturer": board.Manufacturer or "Unknown",
+                        "Model": board.Product or "Unknown",
+                        "Serial Number": board.SerialNumber or "Unknown",
+                        "Version": board.Version or "Unknown"
+                    })
+                    break
+                
+                for bios in results["bios"]:
+                    motherboard_info.update({
+                        "BIOS Manufacturer": bios.Manufacturer or "Unknown",
+                        "BIOS Version": bios.SMBIOSBIOSVersion or "Unknown",
+                        "BIOS Date": bios.ReleaseDate or "Unknown"
+                    })
+                    break
+            except:
+                pass
+        
+        return motherboard_info
+    
+    def get_graphics_info(self):
+        return [record for key, record in self.get_graphics_cards()]
+    
+    def get_graphics_cards(self):
+        """One (key, record) per graphics card.
+        
+        WMI adapters and live GPU readings of the same card are merged into
+        one record (see match_gpus). The key of a card with live readings is
+        its GPUReading.key, so refreshed readings can be routed to it.
+        """
+        controllers = self.cache.get('video_controllers', self.query_video_controllers)
+        try:
+            gpus = self.get_gpus()
+        except:
+            gpus = []
+        matches = match_gpus(controllers, gpus)
+        
+        cards = []
+        for i, controller in enumerate(controllers):
+            gpu = matches.get(i)
+            if gpu is not None:
+                cards.append((gpu.key, {**controller, **gpu_details(gpu)}))
+            else:
+                cards.append((controller.get("Bus ID") or f"adapter:{i}", dict(controller)))
+        matched = {gpu.key for gpu in matches.values()}
+        for gpu in gpus:
+            if gpu.key not in matched:
+                cards.append((gpu.key, {"Name": gpu.name, **gpu_details(gpu), "Driver": gpu.driver or "Unknown"}))
+        
+        if not cards:
+            cards = [(None, {"Graphics Card": "Information not available"})]
+        
+        return cards
+    
+    def query_video_controllers(self):
+        controllers = []
+        
+        if self.wmi.available:
+            try:
+                fields = ["Name", "AdapterRAM", "DriverVersion", "CurrentHorizontalResolution",
+                          "CurrentVerticalResolution", "CurrentBitsPerPixel", "Status", "PNPDeviceID"]
+                results = self.wmi.query_many({
+                    "controllers": ("Win32_VideoController", fields),
+                    # Location holds the PCI bus, device and function
+                    "drivers": ("Win32_PnPSignedDriver", ["DeviceID", "Location"], "DeviceClass = 'DISPLAY'")
+                })
+                locations = {(driver.DeviceID or "").upper(): driver.Location for driver in results["drivers"]}
+                for gpu in results["controllers"]:
+                    if gpu.Name:
+                        identity = {}
+                        bus_id = bus_id_from_location(locations.get((gpu.PNPDeviceID or "").upper()))
+                        if bus_id:
+                            identity["Bus ID"] = bus_id
+                        pci_id = pci_id_from_pnp(gpu.PNPDeviceID)
+                        if pci_id:
+                            identity["PCI ID"] = pci_id
+                        controllers.append({
+                            "Name": gpu.Name,
+                            "RAM": f"{gpu.AdapterRAM / (1024**3):.1f} GB" if gpu.AdapterRAM else "Unknown",
+                            "Driver Version": gpu.DriverVersion or "Unknown",
+                            "Resolution": f"{gpu.CurrentHorizontalResolution}x{gpu.CurrentVerticalResolution}" if gpu.CurrentHorizontalResolution else "Unknown",
+                            "Color Depth": f"{gpu.CurrentBitsPerPixel} bit" if gpu.CurrentBitsPerPixel else "Unknown",
+                            "Status": gpu.Status or "Unknown",
+                            **identity
+                        })
+            except:
+                pass
+        
+        return controllers
+    
+    def get_storage_info(self):
+        storage_info = []
+        
+        # Partitions are listed once and their usage queried in parallel
+        try:
+            partitions = psutil.disk_partitions()
+        except:
+            partitions = []
+        usages, timed_out = self.disk_usage.query([partition.mountpoint for partition in partitions])
+        
+        # Group the partitions by physical disk through the association index
+        index = self.cache.get('partition_index', self.query_partition_index)
+        by_disk = {}
+        for partition in partitions:
+            by_disk.setdefault(index.get(partition_key(partition.device)), []).append(partition)
+        
+        def details(partition):
+            if partition.mountpoint in timed_out:
+                return {"File System": partition.fstype, "Usage": "Not responding"}
+            usage = usages.get(partition.mountpoint)
+            return partition_details(partition, usage) if usage is not None else None
+        
+        # Drive models and sizes are cached; partition usage is always fresh
+        for disk in self.cache.get('disk_drives', self.query_disk_drives):
+            disk_info = dict(disk)
+            for partition in by_disk.pop(disk_io_name(disk), []):
+                partition_info = details(partition)
+                if partition_info is not None:
+                    disk_info[f"Partition {partition.device}"] = partition_info
+            storage_info.append(disk_info)
+        
+        # Partitions not on a known disk (network shares, virtual filesystems,
+        # or every partition when no disk could be listed)
+        for partitions_left in by_disk.values():
+            for partition in partitions_left:
+                partition_info = details(partition)
+                if partition_info is not None:
+                    storage_info.append({"Drive": partition.device, **partition_info})
+        
+        if not storage_info:
+            storage_info = [{"Storage": "Information not available"}]
+        
+        return storage_info
+    
+    def query_partition_index(self):
+        """Map each partition key ('C:' or 'sda1') to the disk_io_name of its physical disk"""
+        if not self.wmi.available:
+            return sysfs_partition_index()
+        
+        index = {}
+        try:
+            results = self.wmi.query_many({
+                "disk_partitions": ("Win32_DiskDriveToDiskPartition", ["Antecedent", "Dependent"]),
+                "logical_disks": ("Win32_LogicalDiskToPartition", ["Antecedent", "Dependent"])
+            })
+            partition_disks = {}
+            for link in results["disk_partitions"]:
+                drive = re.search(r"PHYSICALDRIVE(\d+)", wmi_reference_id(link.Antecedent) or "", re.IGNORECASE)
+                if drive:
+                    partition_disks[wmi_reference_id(link.Dependent)] = f"PhysicalDrive{drive.group(1)}"
+            for link in results["logical_disks"]:
+                disk = partition_disks.get(wmi_reference_id(link.Antecedent))
+                letter = wmi_reference_id(link.Dependent)
+                if disk and letter:
+                    index[letter.upper()] = disk
+        except:
+            pass
+        return index
+    
+    def query_disk_drives(self):
+        disks = []
+        
+        if self.wmi.available:
+            try:
+                fields = ["Index", "Model", "Size", "InterfaceType", "SerialNumber", "Status"]
+                for disk in self.wmi.query("Win32_DiskDrive", fields):
+                    disks.append({
+                        # Name of the drive in psutil.disk_io_counters(perdisk=True)
+                        "Device": f"PhysicalDrive{disk.Index}" if disk.Index is not None else "Unknown",
+                        "Model": disk.Model or "Unknown",
+                        "Size": f"{int(disk.Size) / (1024**3):.1f} GB" if disk.Size else "Unknown",
+                        "Interface": disk.InterfaceType or "Unknown",
+                        "Serial Number": disk.SerialNumber.strip() if disk.SerialNumber else "Unknown",
+                        "Status": disk.Status or "Unknown"
+                    })
+            except:
+                pass
+        else:
+            for disk in sysfs_disks():
+                disks.append({
+                    "Device": disk["name"],
+                    "Model": disk["model"] or "Unknown",
+                    "Size": f"{disk['size'] / (1024**3):.1f} GB" if disk["size"] else "Unknown",
+                    "Interface": disk["interface"] or "Unknown",
+                    "Serial Number": disk["serial"] or "Unknown",
+                    "Status": disk["state"] or "Unknown"
+                })
+        
+        return disks
+    
+    def get_optical_drives_info(self):
+        return self.cache.get('optical', self.query_optical_drives_info)
+    
+    def query_optical_drives_info(self):
+        optical_info = []
+        
+        if self.wmi.available:
+            try:
+                fields = ["Name", "Drive", "Manufacturer", "MediaType", "Status", "TransferRate"]
+                for drive in self.wmi.query("Win32_CDROMDrive", fields):
+                    optical_info.append({
+                        "Name": drive.Name or "Unknown",
+                        "Drive Letter": drive.Drive or "Unknown",
+                        "Manufacturer": drive.Manufacturer or "Unknown",
+                        "Media Type": drive.MediaType or "Unknown",
+                        "Status": drive.Status or "Unknown",
+                        "Transfer Rate": f"{drive.TransferRate} KB/s" if drive.TransferRate else "Unknown"
+                    })
+            except:
+                pass
+        
+        return optical_info
+    
+    def get_audio_info(self):
+        return self.cache.get('audio', self.query_audio_info)
+    
+    def query_audio_info(self):
+        audio_info = []
+        
+        if self.wmi.available:
+            try:
+                for device in self.wmi.query("Win32_SoundDevice", ["Name", "Manufacturer", "Status", "DeviceID"]):
+                    if device.Name:
+                        audio_info.append({
+                            "Name": device.Name,
+                            "Manufacturer": device.Manufacturer or "Unknown",
+                            "Status": device.Status or "Unknown",
+                            "Device ID": device.DeviceID or "Unknown"
+                        })
+            except:
+                pass
+        
+        return audio_info
+    
+    def get_peripherals_info(self):
+        return self.cache.get('peripherals', self.query_peripherals_info)
+    
+    def query_peripherals_info(self):
+        peripheral_info = {
+            "USB Devices": [],
+            "Keyboards": [],
+            "Mice": [],
+            "Printers": [],
+            "Other Devices": []
+        }
+        
+        if self.wmi.available:
+            try:
+                device_fields = ["Name", "DeviceID", "Status"]
+                results = self.wmi.query_many({
+                    "usb": ("Win32_USBHub", device_fields),
+                    "keyboards": ("Win32_Keyboard", device_fields),
+                    "mice": ("Win32_PointingDevice", device_fields + ["NumberOfButtons"]),
+                    "printers": ("Win32_Printer", ["Name", "PrinterStatus", "PortName", "DriverName"]),
+                    "pnp": ("Win32_PnPEntity", device_fields)
+                })
+                
+                # USB Devices
+                for device in results["usb"]:
+                    if device.Name:
+                        peripheral_info["USB Devices"].append({
+                            "Name": device.Name,
+                            "Device ID": device.DeviceID or "Unknown",
+                            "Status": device.Status or "Unknown"
+                        })
+                
+                # Keyboards
+                for keyboard in results["keyboards"]:
+                    if keyboard.Name:
+                        peripheral_info["Keyboards"].append({
+                            "Name": keyboard.Name,
+                            "Device ID": keyboard.DeviceID or "Unknown",
+                            "Status": keyboard.Status or "Unknown"
+                        })
+                
+                # Mice
+                for mouse in results["mice"]:
+                    if mouse.Name:
+                        peripheral_info["Mice"].append({
+                            "Name": mouse.Name,
+                            "Device ID": mouse.DeviceID or "Unknown",
+                            "Status": mouse.Status or "Unknown",
+                            "Number of Buttons": mouse.NumberOfButtons or "Unknown"
+                        })
+                
+                # Printers
+                for printer in results["printers"]:
+                    if printer.Name:
+                        peripheral_info["Printers"].append({
+                            "Name": printer.Name,
+                            "Status": printer.PrinterStatus or "Unknown",
+                            "Port": printer.PortName or "Unknown",
+                            "Driver": printer.DriverName or "Unknown"
+                        })
+                
+                # Other PnP Devices
+                for device in results["pnp"]:
+                    if device.Name and not any(keyword in device.Name.lower() for keyword in ['usb', 'keyboard', 'mouse', 'printer', 'audio', 'video']):
+                        peripheral_info["Other Devices"].append({
+                            "Name": device.Name,
+                            "Device ID": device.DeviceID or "Unknown",
+                            "Status": device.Status or "Unknown"
+                        })
+            except:
+                pass
+        
+        return peripheral_info
+    
+    def get_network_info(self):
+        network_info = []
+        
+        # Get network interfaces using psutil
+        interfaces = psutil.net_if_addrs()
+        stats = psutil.net_if_stats()
+        
+        for interface_name, addresses in interfaces.items():
+            interface_info = {
+                "Name": interface_name,
+                "Status": "Up" if stats.get(interface_name, {}).isup else "Down" if interface_name in stats else "Unknown"
+            }
+            
+            for addr in addresses:
+                if addr.family == socket.AF_INET:
+                    interface_info["IPv4 Address"] = addr.address
+                    interface_info["Netmask"] = addr.netmask
+                elif addr.family == socket.AF_INET6:
+                    interface_info["IPv6 Address"] = addr.address
+                elif addr.family == psutil.AF_LINK:
+                    interface_info["MAC Address"] = addr.address
+            
+            if interface_name in stats:
+                interface_info["Speed"] = f"{stats[interface_name].speed} Mbps" if stats[interface_name].speed > 0 else "Unknown"
+                interface_info["MTU"] = stats[interface_name].mtu
+            
+            network_info.append(interface_info)
+        
+        # Enhanced info using WMI
+        wmi_adapters = self.cache.get('network_adapters', self.query_network_adapters)
+        
+        # Merge WMI info with psutil info
+        for interface in network_info:
+            interface_name = interface["Name"]
+            if interface_name in wmi_adapters:
+                interface.update(wmi_adapters[interface_name])
+        
+        return network_info
+    
+    def query_network_adapters(self):
+        wmi_adapters = {}
+        
+        if self.wmi.available:
+            try:
+                fields = ["NetConnectionID", "MACAddress", "Manufacturer", "ProductName", "AdapterType", "Speed"]
+                for adapter in self.wmi.query("Win32_NetworkAdapter", fields):
+                    if adapter.NetConnectionID and adapter.MACAddress:
+                        wmi_adapters[adapter.NetConnectionID] = {
+                            "Manufacturer": adapter.Manufacturer or "Unknown",
+                            "Product Name": adapter.ProductName or "Unknown",
+                            "MAC Address": adapter.MACAddress,
+                            "Adapter Type": adapter.AdapterType or "Unknown",
+                            "Speed": f"{int(adapter.Speed) / 1000000:.0f} Mbps" if adapter.Speed else "Unknown"
+                        }
+            except:
+                pass
+        
+        return wmi_adapters
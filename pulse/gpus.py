@@ -0,0 +1,466 @@
+import ctypes
+import ctypes.util
+import os
+import re
+import sys
+import threading
+import time
+
+from collections import namedtuple
+
+from .sensors import natural_key, read_text
+try:
+    import GPUtil
+    GPUTIL_AVAILABLE = True
+except ImportError:
+    GPUTIL_AVAILABLE = False
+
+
+# One GPU at one instant: load in %, memory in MB, temperature in °C, clocks
+# in MHz and power in W; None where the source cannot tell. `key` is stable
+# across reads, the PCI bus ID when it is known. pci_id is "vendor:device"
+# in lowercase hex.
+GPUReading = namedtuple("GPUReading", "key name load memory_used memory_total temperature "
+                                      "core_clock memory_clock power driver bus_id pci_id")
+
+
+def pci_bus_id(text):
+    """Normalize a PCI bus ID such as 00000000:01:00.0 to 0000:01:00.0, or None"""
+    match = re.search(r"([0-9a-fA-F]+):([0-9a-fA-F]+):([0-9a-fA-F]+)\.([0-7])", text or "")
+    if not match:
+        return None
+    domain, bus, device, function = match.groups()
+    return f"{int(domain, 16):04x}:{int(bus, 16):02x}:{int(device, 16):02x}.{function}"
+
+
+def pci_id_from_pnp(pnp_device_id):
+    """vendor:device out of a Windows PNPDeviceID such as PCI\\VEN_10DE&DEV_2786&..."""
+    match = re.search(r"VEN_([0-9A-F]{4})&DEV_([0-9A-F]{4})", pnp_device_id or "", re.IGNORECASE)
+    return f"{match.group(1)}:{match.group(2)}".lower() if match else None
+
+
+def bus_id_from_location(location):
+    """PCI bus ID out of a Windows device location such as "PCI bus 1, device 0, function 0" """
+    match = re.search(r"bus (\d+), device (\d+), function (\d+)", location or "", re.IGNORECASE)
+    if not match:
+        return None
+    bus, device, function = (int(part) for part in match.groups())
+    return f"0000:{bus:02x}:{device:02x}.{function}"
+
+
+def name_key(name):
+    """GPU name compared case-insensitively, without (R)/(TM) marks"""
+    name = re.sub(r"\((r|tm)\)", "", (name or "").casefold())
+    return " ".join(name.split())
+
+
+# Inventory record field -> GPUReading attribute identifying the same card,
+# strongest first
+GPU_IDENTITIES = (
+    ("Bus ID", "bus_id"),
+    ("PCI ID", "pci_id"),
+    ("Name", "name"),
+)
+
+
+def match_gpus(records, readings):
+    """Pair inventory records with the live reading of the same card.
+
+    A record is matched by PCI bus ID, then by vendor:device ID, then by
+    name, and each reading is used at most once. When both sides know their
+    bus ID only that is compared, so two identical cards are not swapped.
+    Returns {record index: reading}.
+    """
+    matches = {}
+    unmatched = list(readings)
+    for field, attribute in GPU_IDENTITIES:
+        for index, record in enumerate(records):
+            if index in matches or not record.get(field):
+                continue
+            wanted = name_key(record[field]) if field == "Name" else record[field]
+            for reading in unmatched:
+                value = getattr(reading, attribute)
+                if not value or (field != "Bus ID" and record.get("Bus ID") and reading.bus_id):
+                    continue
+                if (name_key(value) if field == "Name" else value) == wanted:
+                    matches[index] = reading
+                    unmatched.remove(reading)
+                    break
+    return matches
+
+
+class GPUSource:
+    """A way of reading every GPU it knows; read() returns [GPUReading].
+
+    Sources keep their library handles or open files between reads and
+    release them in close(). A fallback source is only used when no source
+    before it found a GPU.
+    """
+    name = "unknown"
+    fallback = False
+
+    def read(self):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+NVML_SUCCESS = 0
+NVML_TEMPERATURE_GPU = 0
+NVML_CLOCK_GRAPHICS = 0
+NVML_CLOCK_MEM = 2
+NVML_BUFFER_SIZE = 96
+
+
+class NVMLUtilization(ctypes.Structure):
+    _fields_ = [("gpu", ctypes.c_uint), ("memory", ctypes.c_uint)]
+
+
+class NVMLMemory(ctypes.Structure):
+    _fields_ = [("total", ctypes.c_ulonglong), ("free", ctypes.c_ulonglong), ("used", ctypes.c_ulonglong)]
+
+
+class NVMLPciInfo(ctypes.Structure):
+    _fields_ = [("busIdLegacy", ctypes.c_char * 16), ("domain", ctypes.c_uint), ("bus", ctypes.c_uint),
+                ("device", ctypes.c_uint), ("pciDeviceId", ctypes.c_uint), ("pciSubSystemId", ctypes.c_uint),
+                ("busId", ctypes.c_char * 32)]
+
+
+class NVMLError(OSError):
+    def __init__(self, function, code):
+        super().__init__(f"{function} failed with NVML error {code}")
+        self.code = code
+
+
+def load_nvml():
+    """The NVIDIA management library that ships with the driver"""
+    if sys.platform == "win32":
+        candidates = ["nvml.dll", os.path.join(os.environ.get("ProgramFiles", r"C:\Program Files"),
+                                               "NVIDIA Corporation", "NVSMI", "nvml.dll")]
+    else:
+        candidates = ["libnvidia-ml.so.1", ctypes.util.find_library("nvidia-ml")]
+    for candidate in candidates:
+        if candidate:
+            try:
+                return ctypes.CDLL(candidate)
+            except OSError:
+                continue
+    raise OSError("NVML library not found")
+
+
+class NVMLSource(GPUSource):
+    """NVIDIA GPUs through NVML, called with ctypes.
+
+    The library is initialized once and the device handles, names and bus
+    IDs are looked up on the first read, so every later read is a handful
+    of in-process calls instead of an nvidia-smi run. `library` can be any
+    object with the NVML functions, for tests.
+    """
+    name = "NVML"
+
+    def __init__(self, library=None):
+        self.library = library
+        self._nvml = None
+        self._devices = None  # [(handle, name, bus id, pci id)]
+        self._driver = None
+
+    def _call(self, function, *args):
+        code = getattr(self._nvml, function)(*args)
+        if code != NVML_SUCCESS:
+            raise NVMLError(function, code)
+
+    def _query(self, function, *args):
+        """Like _call, but False for readings a device does not support"""
+        try:
+            self._call(function, *args)
+            return True
+        except NVMLError:
+            return False
+
+    def _uint(self, function, *args):
+        value = ctypes.c_uint()
+        return value.value if self._query(function, *args, ctypes.byref(value)) else None
+
+    def _open(self):
+        self._nvml = self.library or load_nvml()
+        self._call("nvmlInit_v2")
+        buffer = ctypes.create_string_buffer(NVML_BUFFER_SIZE)
+        self._driver = buffer.value.decode() if self._query("nvmlSystemGetDriverVersion", buffer,
+                                                                NVML_BUFFER_SIZE) else None
+        count = ctypes.c_uint()
+        self._call("nvmlDeviceGetCount_v2", ctypes.byref(count))
+        devices = []
+        for index in range(count.value):
+            handle = ctypes.c_void_p()
+            self._call("nvmlDeviceGetHandleByIndex_v2", index, ctypes.byref(handle))
+            name = buffer.value.decode(errors="replace") if self._query(
+                "nvmlDeviceGetName", handle, buffer, NVML_BUFFER_SIZE) else f"NVIDIA GPU {index}"
+            pci = NVMLPciInfo()
+            bus_id = pci_id = None
+            if self._query("nvmlDeviceGetPciInfo_v3", handle, ctypes.byref(pci)):
+                bus_id = pci_bus_id(pci.busId.decode())
+                pci_id = f"{pci.pciDeviceId & 0xffff:04x}:{pci.pciDeviceId >> 16:04x}"
+            devices.append((handle, name, bus_id, pci_id))
+        self._devices = devices
+
+    def read(self):
+        if self._devices is None:
+            self._open()
+        readings = []
+        for index, (handle, name, bus_id, pci_id) in enumerate(self._devices):
+            utilization = NVMLUtilization()
+            memory = NVMLMemory()
+            has_memory = self._query("nvmlDeviceGetMemoryInfo", handle, ctypes.byref(memory))
+            power = self._uint("nvmlDeviceGetPowerUsage", handle)
+            readings.append(GPUReading(
+                key=bus_id or f"nvml:{index}",
+                name=name,
+                load=utilization.gpu if self._query("nvmlDeviceGetUtilizationRates", handle,
+                                                    ctypes.byref(utilization)) else None,
+                memory_used=memory.used / (1024**2) if has_memory else None,
+                memory_total=memory.total / (1024**2) if has_memory else None,
+                temperature=self._uint("nvmlDeviceGetTemperature", handle, NVML_TEMPERATURE_GPU),
+                core_clock=self._uint("nvmlDeviceGetClockInfo", handle, NVML_CLOCK_GRAPHICS),
+                memory_clock=self._uint("nvmlDeviceGetClockInfo", handle, NVML_CLOCK_MEM),
+                power=power / 1000.0 if power is not None else None,
+                driver=self._driver,
+                bus_id=bus_id,
+                pci_id=pci_id))
+        return readings
+
+    def close(self):
+        if self._devices is not None:
+            try:
+                self._nvml.nvmlShutdown()
+            except Exception:
+                pass
+        self._devices = None
+
+
+# PCI vendors read from sysfs; NVIDIA cards are left to NVML
+DRM_VENDORS = {
+    "0x1002": "AMD",
+    "0x8086": "Intel",
+}
+
+# Reading -> candidate files relative to the card directory and the factor
+# to the GPUReading unit. amdgpu exposes load, VRAM and its hwmon chip under
+# device/; i915 only reports its clock.
+DRM_FILES = {
+    "load": (("device/gpu_busy_percent",), 1.0),
+    "memory_used": (("device/mem_info_vram_used",), 1.0 / (1024**2)),
+    "temperature": (("device/hwmon/*/temp1_input",), 1.0 / 1000),
+    "core_clock": (("device/hwmon/*/freq1_input", "gt_act_freq_mhz", "gt_cur_freq_mhz"), None),
+    "memory_clock": (("device/hwmon/*/freq2_input",), 1.0 / 1000000),
+    "power": (("device/hwmon/*/power1_average", "device/hwmon/*/power1_input"), 1.0 / 1000000),
+}
+
+
+class DRMCard:
+    """One card under /sys/class/drm with its value files kept open"""
+
+    def __init__(self, directory, vendor):
+        self.directory = directory
+        device = os.path.join(directory, "device")
+        self.bus_id = pci_bus_id(os.path.basename(os.path.realpath(device)))
+        driver = os.path.join(device, "driver")
+        self.driver = os.path.basename(os.path.realpath(driver)) if os.path.exists(driver) else None
+        device_id = (read_text(os.path.join(device, "device")) or "").replace("0x", "")
+        self.pci_id = f"{vendor.replace('0x', '')}:{device_id}" if device_id else None
+        self.name = (read_text(os.path.join(device, "product_name"))
+                     or f"{DRM_VENDORS[vendor]} GPU [{vendor.replace('0x', '')}:{device_id}]")
+        vram = read_text(os.path.join(device, "mem_info_vram_total"))
+        self.memory_total = int(vram) / (1024**2) if vram and vram.isdigit() else None
+        self.files = {}  # reading -> (fd, factor)
+        for reading, (patterns, factor) in DRM_FILES.items():
+            for pattern in patterns:
+                path = self._find(pattern)
+                if path is None:
+                    continue
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except OSError:
+                    continue
+                if factor is None:
+                    # hwmon clocks are in Hz, the i915 gt_* files in MHz
+                    factor = 1.0 / 1000000 if path.endswith("_input") else 1.0
+                self.files[reading] = (fd, factor)
+                break
+
+    def _find(self, pattern):
+        directory, _, name = pattern.rpartition("/")
+        if "*" not in directory:
+            path = os.path.join(self.directory, pattern)
+            return path if os.path.exists(path) else None
+        parent = os.path.join(self.directory, directory.split("/*")[0])
+        try:
+            entries = sorted(os.listdir(parent), key=natural_key)
+        except OSError:
+            return None
+        for entry in entries:
+            path = os.path.join(parent, entry, name)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def read(self):
+        values = {}
+        for reading, (fd, factor) in self.files.items():
+            try:
+                values[reading] = int(os.pread(fd, 32, 0)) * factor
+            except (OSError, ValueError):
+                values[reading] = None
+        return GPUReading(key=self.bus_id or self.directory, name=self.name,
+                          load=values.get("load"), memory_used=values.get("memory_used"),
+                          memory_total=self.memory_total, temperature=values.get("temperature"),
+                          core_clock=values.get("core_clock"), memory_clock=values.get("memory_clock"),
+                          power=values.get("power"), driver=self.driver, bus_id=self.bus_id,
+                          pci_id=self.pci_id)
+
+    def close(self):
+        for fd, factor in self.files.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.files = {}
+
+
+class SysfsGPUSource(GPUSource):
+    """AMD (amdgpu) and Intel (i915) GPUs from /sys/class/drm.
+
+    The cards and their value files are found once; each read is one pread
+    per file. The root can point at a fake tree.
+    """
+    name = "sysfs"
+
+    def __init__(self, root="/sys/class/drm"):
+        self.root = root
+        self._cards = None
+
+    def _discover(self):
+        cards = []
+        try:
+            entries = sorted(os.listdir(self.root), key=natural_key)
+        except OSError:
+            return cards
+        for entry in entries:
+            # card0-DP-1 and friends are connectors of card0
+            if not re.fullmatch(r"card\d+", entry):
+                continue
+            directory = os.path.join(self.root, entry)
+            vendor = read_text(os.path.join(directory, "device", "vendor"))
+            if vendor in DRM_VENDORS:
+                cards.append(DRMCard(directory, vendor))
+        return cards
+
+    def read(self):
+        if self._cards is None:
+            self._cards = self._discover()
+        return [card.read() for card in self._cards]
+
+    def close(self):
+        for card in self._cards or []:
+            card.close()
+        self._cards = None
+
+
+class GPUtilSource(GPUSource):
+    """NVIDIA GPUs through GPUtil, which runs nvidia-smi on every read"""
+    name = "GPUtil"
+    fallback = True
+
+    def read(self):
+        readings = []
+        for gpu in GPUtil.getGPUs():
+            readings.append(GPUReading(
+                key=f"gputil:{gpu.uuid or gpu.id}", name=gpu.name, load=gpu.load * 100,
+                memory_used=gpu.memoryUsed, memory_total=gpu.memoryTotal,
+                temperature=gpu.temperature or None, core_clock=None, memory_clock=None, power=None,
+                driver=gpu.driver, bus_id=None, pci_id=None))
+        return readings
+
+
+class GPUMonitor:
+    """Read every GPU through the sources that work on this machine.
+
+    Discovery tries every source once and keeps those that found a GPU; a
+    GPU already reported by an earlier source (same key) is not repeated.
+    A reading is shared by all callers for `ttl` seconds, so the graphics
+    page, the temperature list and the journal cost one read per tick. When
+    a source fails, discovery runs again; when nothing works it is retried
+    at most every `retry_after` seconds.
+    """
+
+    def __init__(self, sources, ttl=1.0, retry_after=60.0):
+        self.sources = list(sources)
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.active = None
+        self._readings = []
+        self._expires = 0.0
+        self._next_discovery = 0.0
+        self._lock = threading.Lock()
+
+    def read(self):
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._expires:
+                self._readings = self._read(now)
+                self._expires = now + self.ttl
+            return self._readings
+
+    def _read(self, now):
+        if self.active is None:
+            return self._discover(now)
+        readings = {}
+        for source in self.active:
+            try:
+                for reading in source.read():
+                    readings.setdefault(reading.key, reading)
+            except Exception:
+                source.close()
+                self.active = None
+                return self._discover(now)
+        return list(readings.values())
+
+    def _discover(self, now):
+        if now < self._next_discovery:
+            return []
+        readings = {}
+        self.active = []
+        for source in self.sources:
+            if source.fallback and readings:
+                continue
+            try:
+                found = source.read()
+            except Exception:
+                found = None
+            if found:
+                self.active.append(source)
+                for reading in found:
+                    readings.setdefault(reading.key, reading)
+            else:
+                source.close()
+        if not self.active:
+            self.active = None
+            self._next_discovery = now + self.retry_after
+        return list(readings.values())
+
+    def close(self):
+        with self._lock:
+            for source in self.sources:
+                source.close()
+            self.active = None
+            self._expires = 0.0
+
+
+def default_gpu_sources():
+    """GPU sources worth probing on this machine, in order of preference"""
+    sources = [NVMLSource()]
+    if sys.platform.startswith("linux"):
+        sources.append(SysfsGPUSource())
+    if GPUTIL_AVAILABLE:
+        sources.append(GPUtilSource())
+    return sources
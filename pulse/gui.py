@@ -0,0 +1,838 @@
+import customtkinter as ctk
+import psutil
+
+from datetime import datetime
+from functools import partial
+
+from .bus import MetricBus
+from .engine import SystemInfoEngine, disk_io_name, gpu_details, gpu_series, percent_text
+from .loader import PageLoader
+from .processes import SORT_KEYS, top_processes
+from .scheduler import RefreshScheduler
+from .widgets import (CoreHeatmap, GroupedList, KeyedRows, LiveValues, Page, PageCache, Sparkline,
+                      VirtualList)
+
+
+# Refresh period of each live metric group, in seconds
+REFRESH_PERIODS = {
+    'live': 1.0,
+    'temperatures': 5.0,
+    'sensors': 2.0,
+    'gpus': 3.0,
+    'network': 1.0,
+    'processes': 2.0,
+}
+
+# Optional sampler field behind each metric family (the part before ':'),
+# read only while one of its metrics has subscribers
+SAMPLER_FIELDS = {
+    'process_count': 'process_count',
+    'disk_io': 'disks',
+    'nic_io': 'nics',
+}
+
+# GPU fields refreshed in place on the Graphics page
+GPU_LIVE_FIELDS = ("GPU Load", "Memory Usage", "Temperature", "Core Clock", "Memory Clock", "Power")
+
+# Upper bounds for pages kept alive between visits
+MAX_CACHED_PAGES = 6
+MAX_CACHED_WIDGETS = 5000
+
+# Samples shown by the live charts, one per second
+CHART_SAMPLES = 60
+
+# Process table: rows kept after sorting and rows visible at once
+TOP_PROCESSES = 200
+PROCESS_ROWS = 20
+PROCESS_COLUMNS = "{:>7}  {:<28} {:>7} {:>10} {:>11} {:>8} {:>8}"
+PROCESS_HEADER = PROCESS_COLUMNS.format("PID", "Name", "CPU", "Memory", "I/O", "Threads", "Handles")
+
+# Rows visible at once in the device list
+DEVICE_ROWS = 22
+
+
+def format_bytes(value):
+    if value is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+
+
+def format_disk_io(rates):
+    text = (f"Read: {format_bytes(rates.read_rate)}/s ({rates.read_iops:.0f} IOPS)  ·  "
+            f"Write: {format_bytes(rates.write_rate)}/s ({rates.write_iops:.0f} IOPS)  ·  "
+            f"Latency: {rates.latency:.1f} ms")
+    if rates.busy_percent is not None:
+        text += f"  ·  Busy: {rates.busy_percent:.0f}%"
+    return text
+
+
+def format_nic_traffic(rates):
+    utilization = f"{rates.utilization:.1f}%" if rates.utilization is not None else "Unknown"
+    return (f"↑ {format_bytes(rates.sent_rate)}/s  ↓ {format_bytes(rates.recv_rate)}/s  ·  "
+            f"Utilization: {utilization}")
+
+
+def format_nic_packets(rates):
+    return (f"Packets: {rates.packets_sent_rate:.0f}/s sent, {rates.packets_recv_rate:.0f}/s received  ·  "
+            f"Errors: {rates.error_rate:.0f}/s  ·  Drops: {rates.drop_rate:.0f}/s")
+
+
+def format_device(device):
+    """One line for a device record: its name, then the remaining fields"""
+    values = dict(device)
+    name = values.pop("Name", "Unknown")
+    return f"{name}  —  " + ",  ".join(f"{key}: {value}" for key, value in values.items())
+
+
+def format_process(row):
+    return PROCESS_COLUMNS.format(
+        row.pid, row.name[:28],
+        f"{row.cpu_percent:.1f}%" if row.cpu_percent is not None else "-",
+        format_bytes(row.rss),
+        f"{format_bytes(row.io_rate)}/s" if row.io_rate is not None else "-",
+        row.threads if row.threads is not None else "-",
+        row.handles if row.handles is not None else "-")
+
+
+class SystemInfoApp:
+    def __init__(self, cache_file=None, journal_file=None):
+        # Main window settings
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
+        
+
+        self.root = ctk.CTk()
+        self.root.title("System Information")
+        self.root.geometry("1200x800")
+        self.root.minsize(1000, 600)
+        
+        try:
+            self.root.iconbitmap("pcm.ico")   # aynı klasörde olmalı
+        except Exception as e:
+            print("Error:", e)
+
+        # Collectors and live sampling; the window only displays their results.
+        # Static inventory is cached per collector; F5 drops it and reloads the page
+        self.engine = SystemInfoEngine(cache_file=cache_file, journal_file=journal_file)
+        self.root.bind("<F5>", lambda event: self.refresh_page())
+        
+        # Widgets subscribe to the live metrics they show; nothing else is published
+        self.bus = MetricBus(self.root)
+        self.bus.add_demand_listener(self.track_sampler_fields)
+        
+        # Update control
+        self.current_page = None
+        self.page = None
+        self.update_widgets = LiveValues()  # Widgets of the current page refreshed in place, by key
+        
+        # Built pages are hidden rather than destroyed when another one is shown
+        self.pages = PageCache(max_pages=MAX_CACHED_PAGES, max_widgets=MAX_CACHED_WIDGETS)
+        self.process_sort = "CPU"
+        
+        # Live counters are read on a background thread; Tk callbacks only
+        # look at the latest snapshot
+        self.engine.start()
+        
+        # Collectors run on worker threads, results come back through root.after
+        self.loader = PageLoader(self.root)
+        
+        # Main frames
+        self.create_main_layout()
+        
+        # Sidebar
+        self.create_sidebar()
+        
+        # Content area
+        self.content_frame = ctk.CTkFrame(self.main_frame)
+        self.content_frame.pack(side="right", fill="both", expand=True, padx=10, pady=10)
+        
+        # Periodic refreshes, each on its own timer
+        self.scheduler = RefreshScheduler(self.root, self.loader)
+        self.create_refresh_tasks()
+        
+        # Show summary by default
+        self.show_summary()
+        self.scheduler.start()
+        
+    def create_refresh_tasks(self):
+        """Register the live metrics; a task only does work while its metrics have subscribers"""
+        self.scheduler.add('live', REFRESH_PERIODS['live'], self.publish_snapshot,
+                           active=self.bus.has_subscribers)
+        self.add_metric_task('temperatures', self.engine.get_system_temperatures)
+        self.add_metric_task('sensors', self.engine.get_hardware_sensors)
+        self.add_metric_task('gpus', self.engine.get_gpus)
+        self.scheduler.add('network', REFRESH_PERIODS['network'], self.publish_nic_io,
+                           active=partial(self.bus.wants_any, 'nic_io:'))
+        self.add_metric_task('processes', self.engine.get_processes)
+    
+    def add_metric_task(self, metric, collect):
+        """Collect a metric on a worker every REFRESH_PERIODS[metric] seconds and publish it"""
+        self.scheduler.add(metric, REFRESH_PERIODS[metric], partial(self.bus.publish, metric),
+                           collect=collect, active=partial(self.bus.wants, metric))
+    
+    def track_sampler_fields(self, metric, wanted):
+        """Have the sampler read the field behind a metric only while it is subscribed"""
+        field = SAMPLER_FIELDS.get(metric.partition(':')[0])
+        if field is None:
+            return
+        if wanted:
+            self.engine.sampler.subscribe(field)
+        else:
+            self.engine.sampler.unsubscribe(field)
+    
+    def watch(self, metric, callback):
+        """Subscribe a callback of the page being built; it follows the page on and off screen"""
+        self.page.subscriptions.append((metric, callback))
+        self.bus.subscribe(metric, callback)
+    
+    def watch_label(self, metric, key, label, format):
+        """Show format(value) on a label of the page being built whenever the metric changes"""
+        widgets = self.update_widgets
+        widgets.bind(key, label)
+        self.watch(metric, lambda value: widgets.set_text(key, format(value)))
+    
+    def publish_snapshot(self):
+        """Publish the subscribed readings of the latest sampler snapshot"""
+        snapshot = self.engine.sampler.latest()
+        bus = self.bus
+        bus.publish('cpu_percent', snapshot.cpu_percent)
+        bus.publish('per_cpu', snapshot.per_cpu)
+        bus.publish('memory', snapshot.memory)
+        bus.publish('process_count', snapshot.process_count)
+        if bus.wants('uptime'):
+            bus.publish('uptime', datetime.now() - datetime.fromtimestamp(snapshot.boot_time))
+        for name, rates in (snapshot.disks or {}).items():
+            bus.publish(f'disk_io:{name}', rates)
+    
+    def publish_nic_io(self):
+        """Publish per-interface rates on the network task's own period"""
+        snapshot = self.engine.sampler.latest()
+        for name, rates in (snapshot.nics or {}).items():
+            self.bus.publish(f'nic_io:{name}', rates)
+    
+    def update_cpu_usage(self, cpu_percent):
+        self.update_widgets.set_progress('cpu_progress', cpu_percent / 100)
+        self.update_widgets.set_text('cpu_label', f"Total: {percent_text(cpu_percent)}")
+        self.update_chart('cpu_chart')
+    
+    def update_core_usage(self, per_cpu):
+        heatmap = self.page.views.get('cores')
+        if heatmap is not None and per_cpu:
+            heatmap.update(per_cpu)
+            busiest = max(range(len(per_cpu)), key=per_cpu.__getitem__)
+            self.update_widgets.set_text('core_peak', f"Busiest: CPU {busiest} at {per_cpu[busiest]:.0f}%")
+    
+    def apply_cpu_temperatures(self, temperatures):
+        """Show temperature readings collected by a loader worker"""
+        if self.temperature_rows is not None:
+            try:
+                # Rows are reused per sensor; only changed readings are redrawn
+                self.temperature_rows.update({sensor_name: f"🌡️ {sensor_name}: {temp_value}"
+                                              for sensor_name, temp_value in temperatures.items()})
+            except:
+                pass
+    
+    def apply_hardware_sensors(self, sensors):
+        """Show fan, voltage and power readings collected by a loader worker"""
+        rows = self.page.views.get('sensors') if self.page else None
+        if rows is not None:
+            rows.update({name: f"{name}: {value}" for name, value in sensors.items()})
+    
+    def update_ram_usage(self, memory):
+        self.update_widgets.set_progress('ram_progress', memory.percent / 100)
+        used_gb = memory.used / (1024**3)
+        total_gb = memory.total / (1024**3)
+        self.update_widgets.set_text('ram_usage_label',
+            f"Used: {used_gb:.1f} GB / {total_gb:.1f} GB ({memory.percent:.1f}%)")
+        self.update_chart('ram_chart')
+    
+    def update_chart(self, key):
+        """Plot the recent history of every series of a chart on the current page"""
+        chart = self.page.views.get(key) if self.page else None
+        if chart is not None:
+            for name in chart.series:
+                chart.plot(name, self.engine.history.values(name, CHART_SAMPLES))
+    
+    def apply_graphics_values(self, gpus):
+        """Show GPU readings collected by a loader worker on the card they belong to"""
+        try:
+            for gpu in gpus:
+                for key, value in gpu_details(gpu).items():
+                    self.update_widgets.set_text(f'gpu_{gpu.key}_{key}', f"{key}: {value}")
+            self.update_chart('gpu_chart')
+        except:
+            pass
+        
+    def apply_processes(self, rows):
+        """Sort a process scan and show the top rows in the table"""
+        table = self.page.views.get('processes') if self.page else None
+        if table is None:
+            return
+        self.page.views['process_rows'] = rows
+        table.set_items([format_process(row) for row in top_processes(rows, self.process_sort, TOP_PROCESSES)])
+        self.update_widgets.set_text('process_count', f"{len(rows)} processes")
+    
+    def sort_processes(self, column):
+        self.process_sort = column
+        rows = self.page.views.get('process_rows') if self.page else None
+        if rows is not None:
+            self.apply_processes(rows)
+        
+    def create_main_layout(self):
+        self.main_frame = ctk.CTkFrame(self.root)
+        self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+    def create_sidebar(self):
+        self.sidebar = ctk.CTkFrame(self.main_frame, width=200)
+        self.sidebar.pack(side="left", fill="y", padx=(0, 10))
+        self.sidebar.pack_propagate(False)
+        
+        # Title
+        title = ctk.CTkLabel(self.sidebar, text="Pc Manager", font=ctk.CTkFont(size=20, weight="bold"))
+        title.pack(pady=(20, 30))
+        
+        # Sections
+        self.buttons = {}
+        sections = [
+            ("📊", "Summary", self.show_summary),
+            ("🖥️", "Operating System", self.show_os),
+            ("⚙️", "CPU", self.show_cpu),
+            ("💾", "RAM", self.show_ram),
+            ("🔧", "Motherboard", self.show_motherboard),
+            ("🎮", "Graphics", self.show_graphics),
+            ("💿", "Storage", self.show_storage),
+            ("💽", "Optical Drives", self.show_optical),
+            ("🔊", "Audio", self.show_audio),
+            ("🔌", "Peripherals", self.show_peripherals),
+            ("🌐", "Network", self.show_network),
+            ("📋", "Processes", self.show_processes)
+        ]
+        
+        for icon, text, command in sections:
+            btn = ctk.CTkButton(
+                self.sidebar,
+                text=f"{icon} {text}",
+                command=command,
+                height=40,
+                anchor="w",
+                font=ctk.CTkFont(size=12)
+            )
+            btn.pack(pady=5, padx=10, fill="x")
+            self.buttons[text] = btn
+    
+    @property
+    def temperature_rows(self):
+        return self.page.views.get('temperatures') if self.page else None
+    
+    def create_page(self, name, title):
+        """Create the frame for a page with its title and a loading placeholder"""
+        page = Page(name, ctk.CTkFrame(self.content_frame, fg_color="transparent"))
+        
+        title_label = ctk.CTkLabel(page.frame, text=title, 
+                                  font=ctk.CTkFont(size=24, weight="bold"))
+        title_label.pack(pady=(0, 20))
+        
+        page.views['placeholder'] = ctk.CTkLabel(page.frame, text="⏳ Loading...", 
+                                                font=ctk.CTkFont(size=16))
+        page.views['placeholder'].pack(pady=50)
+        return page
+    
+    def open_page(self, name, title, collector, render):
+        """Show a page, building it on first visit.
+        
+        A page that was built before is packed again as it is. Otherwise the
+        title and a placeholder appear right away and render(parent, data) runs
+        once the collector has finished on a worker thread. Only the metrics
+        watched by the page on screen stay subscribed.
+        """
+        self.current_page = name
+        self.loader.cancel_pages()
+        
+        if self.page is not None:
+            self.bus.detach(self.page.subscriptions)
+            self.page.frame.pack_forget()
+        
+        page = self.pages.get(name)
+        if page is None:
+            page = self.pages.add(self.create_page(name, title))
+        self.page = page
+        self.update_widgets = page.widgets
+        page.frame.pack(fill="both", expand=True)
+        
+        if page.built:
+            self.bus.attach(page.subscriptions)
+            self.scheduler.run_now('live', 'network')
+            return
+        
+        def ready(data):
+            page.views.pop('placeholder').destroy()
+            render(page.frame, data)
+            page.built = True
+            page.measure()
+            self.pages.trim()
+            self.scheduler.run_now('live', 'network')
+        
+        self.loader.load(name, collector, ready)
+    
+    def refresh_page(self):
+        """Invalidate cached inventory and rebuild the current page"""
+        self.engine.cache.invalidate()
+        name = self.current_page or 'summary'
+        if self.page is not None:
+            self.bus.detach(self.page.subscriptions)
+        self.page = None
+        self.pages.remove(name)
+        getattr(self, f"show_{name}")()
+    
+    def show_summary(self):
+        self.open_page('summary', "📊 System Summary", self.engine.get_system_summary, self.render_summary)
+    
+    def render_summary(self, parent, system_info):
+        # Main info frame
+        info_frame = ctk.CTkFrame(parent)
+        info_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Left column
+        left_frame = ctk.CTkFrame(info_frame)
+        left_frame.pack(side="left", fill="both", expand=True, padx=(10, 5), pady=10)
+        
+        ctk.CTkLabel(left_frame, text="💻 System Information", 
+                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(10, 15))
+        
+        for key, value in system_info["system"].items():
+            frame = ctk.CTkFrame(left_frame)
+            frame.pack(fill="x", padx=10, pady=2)
+            label = ctk.CTkLabel(frame, text=f"{key}: {value}", anchor="w")
+            label.pack(fill="x", padx=10, pady=5)
+            
+            # Labels kept up to date by the live metrics
+            if key == "Available RAM":
+                self.watch_label('memory', 'available_ram', label,
+                                 lambda memory: f"Available RAM: {memory.available / (1024**3):.1f} GB")
+        
+        # Right column
+        right_frame = ctk.CTkFrame(info_frame)
+        right_frame.pack(side="right", fill="both", expand=True, padx=(5, 10), pady=10)
+        
+        ctk.CTkLabel(right_frame, text="📈 Performance", 
+                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(10, 15))
+        
+        for key, value in system_info["performance"].items():
+            frame = ctk.CTkFrame(right_frame)
+            frame.pack(fill="x", padx=10, pady=2)
+            label = ctk.CTkLabel(frame, text=f"{key}: {value}", anchor="w")
+            label.pack(fill="x", padx=10, pady=5)
+            
+            # Labels kept up to date by the live metrics
+            if key == "CPU Usage":
+                self.watch_label('cpu_percent', 'cpu_usage', label,
+                                 lambda percent: f"CPU Usage: {percent_text(percent)}")
+            elif key == "RAM Usage":
+                self.watch_label('memory', 'ram_usage', label,
+                                 lambda memory: f"RAM Usage: {memory.percent:.1f}%")
+            elif key == "Active Processes":
+                self.watch_label('process_count', 'active_processes', label,
+                                 lambda count: f"Active Processes: {count}")
+            elif key == "System Uptime":
+                self.watch_label('uptime', 'uptime', label,
+                                 lambda uptime: f"System Uptime: {str(uptime).split('.')[0]}")
+    
+    def show_os(self):
+        self.open_page('os', "🖥️ Operating System", self.engine.get_os_info, self.render_os)
+    
+    def render_os(self, parent, os_info):
+        # Scrollable frame
+        scrollable = ctk.CTkScrollableFrame(parent)
+        scrollable.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        for key, value in os_info.items():
+            frame = ctk.CTkFrame(scrollable)
+            frame.pack(fill="x", padx=10, pady=5)
+            
+            ctk.CTkLabel(frame, text=key, font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
+            ctk.CTkLabel(frame, text=str(value), wraplength=800).pack(anchor="w", padx=10, pady=(0, 10))
+    
+    def show_cpu(self):
+        self.open_page('cpu', "⚙️ Processor (CPU)", self.collect_cpu_page, self.render_cpu)
+    
+    def collect_cpu_page(self):
+        temperatures = self.engine.get_system_temperatures()
+        return self.engine.get_cpu_info(temperatures), temperatures, self.engine.get_hardware_sensors()
+    
+    def render_cpu(self, parent, data):
+        cpu_info, temperatures, sensors = data
+        
+        # Main frame
+        main_frame = ctk.CTkFrame(parent)
+        main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Left side - information
+        left_frame = ctk.CTkScrollableFrame(main_frame)
+        left_frame.pack(side="left", fill="both", expand=True, padx=(10, 5), pady=10)
+        
+        for key, value in cpu_info.items():
+            frame = ctk.CTkFrame(left_frame)
+            frame.pack(fill="x", padx=5, pady=3)
+            
+            ctk.CTkLabel(frame, text=key, font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=(5, 2))
+            ctk.CTkLabel(frame, text=str(value)).pack(anchor="w", padx=10, pady=(0, 5))
+        
+        # Right side - CPU usage
+        right_frame = ctk.CTkFrame(main_frame)
+        right_frame.pack(side="right", fill="y", padx=(5, 10), pady=10)
+        
+        ctk.CTkLabel(right_frame, text="💹 CPU Usage", 
+                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=10)
+        
+        # CPU percentage
+        cpu_percent = self.engine.sampler.latest().cpu_percent
+        progress = ctk.CTkProgressBar(right_frame)
+        progress.pack(padx=20, pady=10)
+        progress.set((cpu_percent or 0) / 100)
+        
+        cpu_label = ctk.CTkLabel(right_frame, text=f"Total: {percent_text(cpu_percent)}")
+        cpu_label.pack()
+        
+        # Store for updates
+        self.update_widgets.bind('cpu_progress', progress)
+        self.update_widgets.bind('cpu_label', cpu_label)
+        self.watch('cpu_percent', self.update_cpu_usage)
+        
+        # Usage over the last minute
+        chart = Sparkline(right_frame, ["CPU Usage"], samples=CHART_SAMPLES, width=260)
+        chart.canvas.pack(padx=20, pady=10)
+        self.page.views['cpu_chart'] = chart
+        self.update_chart('cpu_chart')
+        
+        # One cell per logical CPU
+        core_section = ctk.CTkFrame(right_frame)
+        core_section.pack(fill="x", padx=10, pady=(10, 0))
+        
+        ctk.CTkLabel(core_section, text="🧩 Per-Core Usage", 
+                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(10, 5))
+        
+        per_cpu = self.engine.sampler.latest().per_cpu
+        heatmap = CoreHeatmap(core_section, len(per_cpu) if per_cpu else psutil.cpu_count(logical=True) or 1)
+        heatmap.canvas.pack(padx=10, pady=5)
+        self.page.views['cores'] = heatmap
+        
+        core_peak = ctk.CTkLabel(core_section, text="Busiest: Measuring...")
+        core_peak.pack(pady=(0, 10))
+        self.update_widgets.bind('core_peak', core_peak)
+        self.watch('per_cpu', self.update_core_usage)
+        
+        # Add temperature section
+        temp_section = ctk.CTkFrame(right_frame)
+        temp_section.pack(fill="x", padx=10, pady=(20, 10))
+        
+        ctk.CTkLabel(temp_section, text="🌡️ Temperatures", 
+                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(10, 5))
+        
+        # Temperature readings frame
+        temp_frame = ctk.CTkFrame(temp_section)
+        temp_frame.pack(fill="x", padx=10, pady=5)
+        
+        # Keep one row per sensor for updates
+        self.page.views['temperatures'] = KeyedRows(temp_frame, empty_text="🌡️ Temperature: Not available")
+        self.apply_cpu_temperatures(temperatures)
+        self.watch('temperatures', self.apply_cpu_temperatures)
+        
+        # Fan, voltage and power sensors (Linux hwmon)
+        if sensors:
+            sensor_section = ctk.CTkFrame(right_frame)
+            sensor_section.pack(fill="x", padx=10, pady=(10, 10))
+            
+            ctk.CTkLabel(sensor_section, text="🌀 Fans & Power", 
+                        font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(10, 5))
+            
+            sensor_frame = ctk.CTkFrame(sensor_section)
+            sensor_frame.pack(fill="x", padx=10, pady=5)
+            
+            self.page.views['sensors'] = KeyedRows(sensor_frame)
+            self.apply_hardware_sensors(sensors)
+            self.watch('sensors', self.apply_hardware_sensors)
+    
+    def show_ram(self):
+        self.open_page('ram', "💾 Memory (RAM)", self.engine.get_ram_info, self.render_ram)
+    
+    def render_ram(self, parent, ram_info):
+        main_frame = ctk.CTkFrame(parent)
+        main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Top section - general info
+        top_frame = ctk.CTkFrame(main_frame)
+        top_frame.pack(fill="x", padx=10, pady=10)
+        
+        # RAM usage
+        memory = self.engine.sampler.latest().memory
+        used_gb = memory.used / (1024**3)
+        total_gb = memory.total / (1024**3)
+        
+        ctk.CTkLabel(top_frame, text="💾 Memory Usage", 
+                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+        
+        progress = ctk.CTkProgressBar(top_frame, width=400)
+        progress.pack(pady=10)
+        progress.set(memory.percent / 100)
+        
+        usage_label = ctk.CTkLabel(top_frame, 
+                    text=f"Used: {used_gb:.1f} GB / {total_gb:.1f} GB ({memory.percent:.1f}%)")
+        usage_label.pack(pady=5)
+        
+        # Store for updates
+        self.update_widgets.bind('ram_progress', progress)
+        self.update_widgets.bind('ram_usage_label', usage_label)
+        self.watch('memory', self.update_ram_usage)
+        
+        # Usage over the last minute
+        chart = Sparkline(top_frame, ["RAM Usage"], samples=CHART_SAMPLES, width=400)
+        chart.canvas.pack(pady=(5, 10))
+        self.page.views['ram_chart'] = chart
+        self.update_chart('ram_chart')
+        
+        # Bottom section - detailed info
+        bottom_frame = ctk.CTkScrollableFrame(main_frame)
+        bottom_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        for key, value in ram_info.items():
+            if not isinstance(value, dict):
+                frame = ctk.CTkFrame(bottom_frame)
+                frame.pack(fill="x", padx=5, pady=3)
+                
+                ctk.CTkLabel(frame, text=key, font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=(5, 2))
+                ctk.CTkLabel(frame, text=str(value)).pack(anchor="w", padx=10, pady=(0, 5))
+            else:
+                # Memory modules
+                module_frame = ctk.CTkFrame(bottom_frame)
+                module_frame.pack(fill="x", padx=5, pady=5)
+                
+                ctk.CTkLabel(module_frame, text=key, font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
+                
+                for subkey, subvalue in value.items():
+                    ctk.CTkLabel(module_frame, text=f"  {subkey}: {subvalue}").pack(anchor="w", padx=20, pady=2)
+    
+    def show_motherboard(self):
+        self.open_page('motherboard', "🔧 Motherboard", self.engine.get_motherboard_info, self.render_motherboard)
+    
+    def render_motherboard(self, parent, mb_info):
+        scrollable = ctk.CTkScrollableFrame(parent)
+        scrollable.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        for key, value in mb_info.items():
+            frame = ctk.CTkFrame(scrollable)
+            frame.pack(fill="x", padx=10, pady=5)
+            
+            ctk.CTkLabel(frame, text=key, font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
+            ctk.CTkLabel(frame, text=str(value), wraplength=800).pack(anchor="w", padx=10, pady=(0, 10))
+    
+    def show_graphics(self):
+        self.open_page('graphics', "🎮 Graphics Cards", self.engine.get_graphics_cards, self.render_graphics)
+    
+    def render_graphics(self, parent, cards):
+        scrollable = ctk.CTkScrollableFrame(parent)
+        scrollable.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Load of every GPU that reports it, over the last minute, in card order
+        recorded = set(self.engine.history.names())
+        load_series = [gpu_series(card_key, "Load") for card_key, gpu in cards
+                       if gpu_series(card_key, "Load") in recorded]
+        if load_series:
+            chart_frame = ctk.CTkFrame(scrollable)
+            chart_frame.pack(fill="x", padx=10, pady=10)
+            ctk.CTkLabel(chart_frame, text="📈 GPU Load", 
+                        font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(10, 5))
+            chart = Sparkline(chart_frame, load_series, samples=CHART_SAMPLES, width=600)
+            chart.canvas.pack(padx=10, pady=(0, 10))
+            self.page.views['gpu_chart'] = chart
+            self.update_chart('gpu_chart')
+        
+        for i, (card_key, gpu) in enumerate(cards):
+            gpu_frame = ctk.CTkFrame(scrollable)
+            gpu_frame.pack(fill="x", padx=10, pady=10)
+            
+            ctk.CTkLabel(gpu_frame, text=f"🎮 Graphics Card {i+1}", 
+                        font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+            
+            for key, value in gpu.items():
+                info_frame = ctk.CTkFrame(gpu_frame)
+                info_frame.pack(fill="x", padx=10, pady=2)
+                
+                label = ctk.CTkLabel(info_frame, text=f"{key}: {value}", anchor="w")
+                label.pack(fill="x", padx=10, pady=5)
+                
+                # Live readings are routed by the card's key, not its position
+                if key in GPU_LIVE_FIELDS:
+                    self.update_widgets.bind(f'gpu_{card_key}_{key}', label)
+        
+        self.watch('gpus', self.apply_graphics_values)
+    
+    def show_storage(self):
+        self.open_page('storage', "💿 Storage Devices", self.engine.get_storage_info, self.render_storage)
+    
+    def render_storage(self, parent, storage_info):
+        scrollable = ctk.CTkScrollableFrame(parent)
+        scrollable.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        for disk in storage_info:
+            disk_frame = ctk.CTkFrame(scrollable)
+            disk_frame.pack(fill="x", padx=10, pady=10)
+            
+            disk_name = disk.get('Model', disk.get('Drive', 'Unknown Device'))
+            ctk.CTkLabel(disk_frame, text=f"💿 {disk_name}", 
+                        font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+            
+            # Throughput, IOPS, latency and busy time from the sampler
+            io_name = disk_io_name(disk)
+            if io_name:
+                io_label = ctk.CTkLabel(disk_frame, text="⚡ Measuring I/O...", anchor="w")
+                io_label.pack(fill="x", padx=20, pady=(0, 5))
+                self.watch_label(f'disk_io:{io_name}', f'disk_io_{io_name}', io_label,
+                                 lambda rates: f"⚡ {format_disk_io(rates)}")
+            
+            for key, value in disk.items():
+                if not isinstance(value, dict):
+                    info_frame = ctk.CTkFrame(disk_frame)
+                    info_frame.pack(fill="x", padx=10, pady=2)
+                    ctk.CTkLabel(info_frame, text=f"{key}: {value}", anchor="w").pack(fill="x", padx=10, pady=5)
+                else:
+                    # Partitions
+                    partition_frame = ctk.CTkFrame(disk_frame)
+                    partition_frame.pack(fill="x", padx=10, pady=5)
+                    
+                    ctk.CTkLabel(partition_frame, text=key, font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=(5, 2))
+                    
+                    for subkey, subvalue in value.items():
+                        ctk.CTkLabel(partition_frame, text=f"  {subkey}: {subvalue}").pack(anchor="w", padx=20, pady=1)
+    
+    def show_optical(self):
+        self.open_page('optical', "💽 Optical Drives", self.engine.get_optical_drives_info, self.render_optical)
+    
+    def render_optical(self, parent, optical_info):
+        if not optical_info:
+            ctk.CTkLabel(parent, text="No optical drives found.", 
+                        font=ctk.CTkFont(size=16)).pack(pady=50)
+            return
+        
+        scrollable = ctk.CTkScrollableFrame(parent)
+        scrollable.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        for i, drive in enumerate(optical_info):
+            drive_frame = ctk.CTkFrame(scrollable)
+            drive_frame.pack(fill="x", padx=10, pady=10)
+            
+            ctk.CTkLabel(drive_frame, text=f"💽 Optical Drive {i+1}", 
+                        font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+            
+            for key, value in drive.items():
+                info_frame = ctk.CTkFrame(drive_frame)
+                info_frame.pack(fill="x", padx=10, pady=2)
+                
+                ctk.CTkLabel(info_frame, text=f"{key}: {value}", anchor="w").pack(fill="x", padx=10, pady=5)
+    
+    def show_audio(self):
+        self.open_page('audio', "🔊 Audio Devices", self.engine.get_audio_info, self.render_audio)
+    
+    def render_audio(self, parent, audio_info):
+        if not audio_info:
+            ctk.CTkLabel(parent, text="No audio devices found.", 
+                        font=ctk.CTkFont(size=16)).pack(pady=50)
+            return
+        
+        scrollable = ctk.CTkScrollableFrame(parent)
+        scrollable.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        for i, device in enumerate(audio_info):
+            device_frame = ctk.CTkFrame(scrollable)
+            device_frame.pack(fill="x", padx=10, pady=10)
+            
+            ctk.CTkLabel(device_frame, text=f"🔊 Audio Device {i+1}", 
+                        font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+            
+            for key, value in device.items():
+                info_frame = ctk.CTkFrame(device_frame)
+                info_frame.pack(fill="x", padx=10, pady=2)
+                
+                ctk.CTkLabel(info_frame, text=f"{key}: {value}", anchor="w").pack(fill="x", padx=10, pady=5)
+    
+    def show_peripherals(self):
+        self.open_page('peripherals', "🔌 Peripherals", self.engine.get_peripherals_info, self.render_peripherals)
+    
+    def render_peripherals(self, parent, peripheral_info):
+        # One line per device and only DEVICE_ROWS labels, however many devices
+        # there are; click a category to fold it
+        devices = GroupedList(parent, rows=DEVICE_ROWS, empty_text="No peripherals found.")
+        devices.frame.pack(fill="both", expand=True, padx=10, pady=10)
+        devices.set_groups({category: [format_device(device) for device in entries]
+                            for category, entries in peripheral_info.items()})
+        self.page.views['devices'] = devices
+    
+    def show_network(self):
+        self.open_page('network', "🌐 Network Adapters", self.engine.get_network_info, self.render_network)
+    
+    def render_network(self, parent, network_info):
+        scrollable = ctk.CTkScrollableFrame(parent)
+        scrollable.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        for i, adapter in enumerate(network_info):
+            adapter_frame = ctk.CTkFrame(scrollable)
+            adapter_frame.pack(fill="x", padx=10, pady=10)
+            
+            adapter_name = adapter.get('Name', f'Network Adapter {i+1}')
+            ctk.CTkLabel(adapter_frame, text=f"🌐 {adapter_name}", 
+                        font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+            
+            # Live traffic, refreshed in place from the sampler
+            if 'Name' in adapter:
+                for key, text, format in (('net_traffic', "⚡ Measuring traffic...",
+                                           lambda rates: f"⚡ {format_nic_traffic(rates)}"),
+                                          ('net_packets', "📦 Measuring packets...",
+                                           lambda rates: f"📦 {format_nic_packets(rates)}")):
+                    label = ctk.CTkLabel(adapter_frame, text=text, anchor="w")
+                    label.pack(fill="x", padx=20)
+                    self.watch_label(f"nic_io:{adapter['Name']}", f"{key}_{adapter['Name']}", label, format)
+            
+            for key, value in adapter.items():
+                info_frame = ctk.CTkFrame(adapter_frame)
+                info_frame.pack(fill="x", padx=10, pady=2)
+                
+                ctk.CTkLabel(info_frame, text=f"{key}: {value}", anchor="w").pack(fill="x", padx=10, pady=5)
+
+    def show_processes(self):
+        self.open_page('processes', "📋 Processes", self.engine.get_processes, self.render_processes)
+    
+    def render_processes(self, parent, rows):
+        controls = ctk.CTkFrame(parent, fg_color="transparent")
+        controls.pack(fill="x", padx=10, pady=(10, 5))
+        
+        ctk.CTkLabel(controls, text="Sort by:").pack(side="left", padx=(10, 5))
+        sort = ctk.CTkSegmentedButton(controls, values=list(SORT_KEYS), command=self.sort_processes)
+        sort.set(self.process_sort)
+        sort.pack(side="left")
+        
+        count_label = ctk.CTkLabel(controls, text="")
+        count_label.pack(side="right", padx=10)
+        self.update_widgets.bind('process_count', count_label)
+        
+        mono = ctk.CTkFont(family="Consolas", size=12)
+        ctk.CTkLabel(parent, text=PROCESS_HEADER, anchor="w", 
+                    font=ctk.CTkFont(family="Consolas", size=12, weight="bold")).pack(fill="x", padx=25)
+        
+        # Only PROCESS_ROWS labels exist however many processes there are
+        table = VirtualList(parent, rows=PROCESS_ROWS, font=mono)
+        table.frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self.page.views['processes'] = table
+        self.apply_processes(rows)
+        self.watch('processes', self.apply_processes)
+    
+    def run(self):
+        """Start the application"""
+        try:
+            self.root.mainloop()
+        finally:
+            self.scheduler.stop()
+            self.bus.stop()
+            self.engine.close()
+            self.loader.shutdown()
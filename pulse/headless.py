@@ -0,0 +1,127 @@
+import json
+import sys
+import time
+
+from .engine import SECTIONS, SystemInfoEngine
+from .journal import JournalError
+
+# Bytes buffered before output is written out
+OUTPUT_BUFFER = 1 << 16
+
+# Seconds measured before a one-shot inventory, so its CPU usage is a reading
+CPU_WINDOW = 0.5
+
+# Seconds between flushes of a snapshot stream, so a pipe sees data
+# regularly without one write per sample
+FLUSH_INTERVAL = 1.0
+
+
+def snapshot_record(snapshot):
+    """JSON-ready dict of a sampler snapshot; readings not taken are left out"""
+    memory = snapshot.memory
+    record = {
+        "timestamp": snapshot.timestamp,
+        "cpu_percent": snapshot.cpu_percent,
+        "per_cpu": snapshot.per_cpu,
+        "memory": {"total": memory.total, "used": memory.used, "available": memory.available,
+                   "percent": memory.percent},
+        "disk_read_rate": snapshot.disk_read_rate,
+        "disk_write_rate": snapshot.disk_write_rate,
+        "net_sent_rate": snapshot.net_sent_rate,
+        "net_recv_rate": snapshot.net_recv_rate,
+    }
+    if snapshot.disks is not None:
+        record["disks"] = {name: rates._asdict() for name, rates in snapshot.disks.items()}
+    if snapshot.nics is not None:
+        record["nics"] = {name: rates._asdict() for name, rates in snapshot.nics.items()}
+    if snapshot.process_count is not None:
+        record["process_count"] = snapshot.process_count
+    return record
+
+
+def write_inventory(engine, output, sections=None):
+    """Write the inventory of the given sections (all by default) as one JSON document"""
+    if not sections or {"summary", "cpu"} & set(sections):
+        engine.sampler.sample()
+        time.sleep(CPU_WINDOW)
+        engine.sampler.sample()
+    json.dump(engine.inventory(sections), output, indent=2, ensure_ascii=False, default=str)
+    output.write("\n")
+
+
+def stream_snapshots(engine, output, interval, count=None, flush_interval=FLUSH_INTERVAL):
+    """Write one NDJSON line per sampler reading every `interval` seconds.
+
+    Readings are taken on this thread against a fixed schedule, so slow
+    writes do not make the stream drift; a reading that is already late is
+    taken right away. Stops after `count` lines (never by default).
+    """
+    encode = json.JSONEncoder(separators=(",", ":"), default=str).encode
+    sampler = engine.sampler
+    # The first reading only primes the counters that rates are computed from
+    sampler.sample()
+    next_sample = time.monotonic() + interval
+    next_flush = time.monotonic() + flush_interval
+    written = 0
+    while count is None or written < count:
+        delay = next_sample - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        next_sample = max(next_sample + interval, time.monotonic())
+        output.write(encode(snapshot_record(sampler.sample())))
+        output.write("\n")
+        written += 1
+        if time.monotonic() >= next_flush:
+            output.flush()
+            next_flush = time.monotonic() + flush_interval
+    output.flush()
+
+
+def open_output(path, mode):
+    """A buffered text stream for path, or stdout for None and '-'.
+
+    Only data goes to this stream; diagnostics are printed to stderr.
+    """
+    if path in (None, "-"):
+        return open(sys.stdout.fileno(), "w", buffering=OUTPUT_BUFFER, encoding="utf-8", closefd=False)
+    return open(path, mode, buffering=OUTPUT_BUFFER, encoding="utf-8")
+
+
+def run(interval=None, output=None, count=None, sections=None, devices=False,
+        cache_file=None, journal_file=None):
+    """Print the inventory, or stream snapshots when an interval is given; returns an exit code"""
+    unknown = [name for name in sections or () if name not in SECTIONS]
+    if unknown:
+        print(f"Unknown section(s): {', '.join(unknown)}. Choose from: {', '.join(SECTIONS)}", file=sys.stderr)
+        return 2
+    try:
+        engine = SystemInfoEngine(cache_file=cache_file, journal_file=journal_file)
+    except (OSError, JournalError) as e:
+        print("Could not open journal file:", e, file=sys.stderr)
+        return 1
+    try:
+        stream = open_output(output, "a" if interval else "w")
+    except OSError as e:
+        print("Could not open output file:", e, file=sys.stderr)
+        engine.close()
+        return 1
+    try:
+        if interval:
+            if devices:
+                engine.sampler.subscribe("disks", "nics", "process_count")
+            stream_snapshots(engine, stream, interval, count)
+        else:
+            write_inventory(engine, stream, sections)
+            stream.flush()
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); nothing left to do
+        return 0
+    finally:
+        try:
+            stream.close()
+        except (BrokenPipeError, OSError):
+            pass
+        engine.close()
+    return 0
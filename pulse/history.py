@@ -0,0 +1,216 @@
+import math
+import threading
+
+from array import array
+
+
+class RingBuffer:
+    """The newest `capacity` (timestamp, value) samples of one metric.
+
+    Samples are stored in two preallocated arrays of doubles, so append() is
+    O(1) and memory never grows. view() hands out memoryviews over those
+    arrays instead of copies; they alias the buffer, so copy them (to_list())
+    if they are kept after later appends.
+    """
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.times = array('d', bytes(8 * capacity))
+        self.values = array('d', bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, timestamp, value):
+        index = self._next
+        self.times[index] = timestamp
+        self.values[index] = value
+        self._next = (index + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def latest(self):
+        """Newest (timestamp, value), or None when empty"""
+        if not self._count:
+            return None
+        index = (self._next - 1) % self.capacity
+        return self.times[index], self.values[index]
+
+    def view(self, last=None):
+        """The newest `last` samples (all by default), oldest first.
+
+        Returns a list of up to two (times, values) memoryview pairs, two when
+        the requested range wraps around the end of the arrays.
+        """
+        count = self._count if last is None else max(0, min(last, self._count))
+        if not count:
+            return []
+        start = (self._next - count) % self.capacity
+        times = memoryview(self.times)
+        values = memoryview(self.values)
+        if start + count <= self.capacity:
+            return [(times[start:start + count], values[start:start + count])]
+        head = self.capacity - start
+        return [(times[start:], values[start:]), (times[:count - head], values[:count - head])]
+
+    def count_since(self, timestamp):
+        """Number of samples taken at or after timestamp (binary search)"""
+        oldest = (self._next - self._count) % self.capacity
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self.times[(oldest + middle) % self.capacity] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return self._count - low
+
+    def to_list(self, last=None):
+        """Copy of view() as a list of (timestamp, value) tuples"""
+        samples = []
+        for times, values in self.view(last):
+            samples.extend(zip(times.tolist(), values.tolist()))
+        return samples
+
+
+class Tier(RingBuffer):
+    """History of one metric at a fixed step, with min/max/avg per bucket.
+
+    Samples falling in the same `step`-second bucket are folded into it, so
+    the tier covers `span` seconds with span / step slots however often it
+    is fed. `values` holds the bucket averages and `times` the bucket starts.
+    """
+
+    def __init__(self, step, span):
+        super().__init__(max(1, int(math.ceil(span / step))))
+        self.step = step
+        self.span = span
+        self.mins = array('d', bytes(8 * self.capacity))
+        self.maxs = array('d', bytes(8 * self.capacity))
+        self.counts = array('I', bytes(4 * self.capacity))
+
+    def add(self, timestamp, value):
+        bucket = math.floor(timestamp / self.step) * self.step
+        last = self.latest()
+        if last is not None and bucket <= last[0]:
+            if bucket < last[0]:
+                return  # older than the open bucket
+            index = (self._next - 1) % self.capacity
+            count = self.counts[index] + 1
+            self.counts[index] = count
+            self.values[index] += (value - self.values[index]) / count
+            self.mins[index] = min(self.mins[index], value)
+            self.maxs[index] = max(self.maxs[index], value)
+            return
+        index = self._next
+        self.append(bucket, value)
+        self.mins[index] = self.maxs[index] = value
+        self.counts[index] = 1
+
+    def stats(self, last=None):
+        """Copy of the newest `last` buckets as (start, min, max, avg) tuples"""
+        count = self._count if last is None else max(0, min(last, self._count))
+        oldest = (self._next - count) % self.capacity
+        buckets = []
+        for offset in range(count):
+            index = (oldest + offset) % self.capacity
+            buckets.append((self.times[index], self.mins[index], self.maxs[index], self.values[index]))
+        return buckets
+
+
+# Metric name -> Snapshot attribute recorded from every sampler reading
+SNAPSHOT_METRICS = {
+    "CPU Usage": "cpu_percent",
+    "Disk Read": "disk_read_rate",
+    "Disk Write": "disk_write_rate",
+    "Network Sent": "net_sent_rate",
+    "Network Received": "net_recv_rate",
+}
+
+
+# (step, span) in seconds of each history tier, finest first
+DEFAULT_TIERS = (
+    (1.0, 10 * 60),
+    (10.0, 6 * 3600),
+    (60.0, 7 * 86400),
+)
+
+
+class History:
+    """Recent samples of every live metric, rolled up into tiers.
+
+    Every metric keeps one Tier per (step, span) pair, each fed directly with
+    every sample, so a long-running session holds fine-grained data for the
+    last minutes and coarser min/max/avg buckets for the last days within a
+    fixed amount of memory. Tiers are created on first use, so any metric
+    (per core, per GPU, per sensor) can be recorded without being declared.
+    """
+
+    def __init__(self, tiers=DEFAULT_TIERS, detail_tiers=DEFAULT_TIERS[:1]):
+        self.tiers = tuple(sorted(tiers))
+        self.detail_tiers = tuple(sorted(detail_tiers))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, timestamp, value, detail=False):
+        """Add a sample; detail metrics (one per core, ...) only get `detail_tiers`"""
+        if value is None:
+            return
+        with self._lock:
+            tiers = self._series.get(name)
+            if tiers is None:
+                steps = self.detail_tiers if detail else self.tiers
+                tiers = self._series[name] = [Tier(step, span) for step, span in steps]
+            for tier in tiers:
+                tier.add(timestamp, value)
+
+    def record_snapshot(self, snapshot):
+        """Sampler listener storing the CPU, RAM, disk and network readings"""
+        for name, attribute in SNAPSHOT_METRICS.items():
+            self.record(name, snapshot.timestamp, getattr(snapshot, attribute))
+        self.record("RAM Usage", snapshot.timestamp, snapshot.memory.percent)
+        for core, percent in enumerate(snapshot.per_cpu or ()):
+            self.record(f"CPU Core {core}", snapshot.timestamp, percent, detail=True)
+
+    def names(self):
+        return list(self._series)
+
+    def series(self, name, seconds=0):
+        """The finest tier of a metric that covers `seconds`, or None"""
+        tiers = self._series.get(name)
+        if tiers is None:
+            return None
+        for tier in tiers:
+            if tier.span >= seconds:
+                return tier
+        return tiers[-1]
+
+    def view(self, name, last=None):
+        """Zero-copy (times, values) segments of the finest tier, see RingBuffer.view()"""
+        series = self.series(name)
+        return series.view(last) if series is not None else []
+
+    def values(self, name, last=None):
+        """The newest values of the finest tier of a metric, oldest first"""
+        values = []
+        for times, segment in self.view(name, last):
+            values.extend(segment)
+        return values
+
+    def recent(self, name, seconds, now):
+        """(timestamp, average) samples of a metric over the last `seconds` before now"""
+        series = self.series(name, seconds)
+        if series is None:
+            return []
+        return series.to_list(series.count_since(now - seconds))
+
+    def rollup(self, name, seconds, now):
+        """(start, min, max, avg) buckets of a metric over the last `seconds` before now"""
+        series = self.series(name, seconds)
+        if series is None:
+            return []
+        return series.stats(series.count_since(now - seconds))
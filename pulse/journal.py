@@ -0,0 +1,196 @@
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+
+from collections import namedtuple
+
+MAGIC = b"PPCJ"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQd")  # magic, version, record size, record count, created
+HEADER_SIZE = 64
+COUNT_OFFSET = 8
+
+# Load of the first GPU_SLOTS GPUs is kept in every record
+GPU_SLOTS = 4
+RECORD = struct.Struct("<dffQQffff" + "f" * GPU_SLOTS + "f")
+
+# Records added to the file each time it has to grow
+GROW_RECORDS = 4096
+
+NAN = float("nan")
+
+JournalRecord = namedtuple("JournalRecord", [
+    "timestamp", "cpu_percent", "memory_percent", "memory_used", "memory_available",
+    "disk_read_rate", "disk_write_rate", "net_sent_rate", "net_recv_rate",
+    "gpu_loads", "temperature",
+])
+
+
+class JournalError(Exception):
+    """A file is not a PulsePC journal or uses another record layout"""
+
+
+def _number(value):
+    return NAN if value is None else float(value)
+
+
+def _value(number):
+    return None if math.isnan(number) else number
+
+
+def pack_record(snapshot, gpu_loads=(), temperature=None):
+    """Record fields for a sampler snapshot; missing readings are stored as NaN"""
+    memory = snapshot.memory
+    loads = [_number(load) for load in list(gpu_loads)[:GPU_SLOTS]]
+    loads += [NAN] * (GPU_SLOTS - len(loads))
+    return (snapshot.timestamp, _number(snapshot.cpu_percent), memory.percent, memory.used,
+            memory.available, _number(snapshot.disk_read_rate), _number(snapshot.disk_write_rate),
+            _number(snapshot.net_sent_rate), _number(snapshot.net_recv_rate), *loads, _number(temperature))
+
+
+def unpack_record(buffer, offset):
+    fields = RECORD.unpack_from(buffer, offset)
+    values = [_value(field) if isinstance(field, float) else field for field in fields]
+    return JournalRecord(*values[:9], tuple(values[9:9 + GPU_SLOTS]), values[9 + GPU_SLOTS])
+
+
+def _read_header(buffer):
+    magic, version, record_size, count, created = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise JournalError("Not a PulsePC journal")
+    if version != VERSION or record_size != RECORD.size:
+        raise JournalError(f"Unsupported journal version {version} with {record_size} byte records")
+    return count, created
+
+
+class JournalWriter:
+    """Append fixed-size records to a journal file through mmap.
+
+    The file is grown in chunks of GROW_RECORDS and records are packed
+    straight into the mapping. The record count in the header is updated
+    only after a record is complete, so a crash never exposes a half
+    written one; the mapping is flushed to disk every `flush_interval`
+    seconds so a machine crash loses at most that much.
+    """
+
+    def __init__(self, path, flush_interval=5.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._file = open(path, "r+b" if os.path.exists(path) else "w+b")
+        size = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0, time.time()).ljust(HEADER_SIZE, b"\0"))
+            self._file.flush()
+            size = HEADER_SIZE
+        # Check the header before touching the file, it may be something else
+        self._file.seek(0)
+        try:
+            self.count, self.created = _read_header(self._file.read(HEADER.size).ljust(HEADER.size, b"\0"))
+        except JournalError:
+            self._file.close()
+            raise
+        self._map = None
+        self._map_file(max(size, HEADER_SIZE + GROW_RECORDS * RECORD.size))
+        self._last_flush = time.monotonic()
+
+    def _map_file(self, size):
+        if self._map is not None:
+            self._map.close()
+        if os.fstat(self._file.fileno()).st_size < size:
+            self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+    def append(self, fields):
+        with self._lock:
+            if self._map is None:
+                return
+            offset = HEADER_SIZE + self.count * RECORD.size
+            if offset + RECORD.size > len(self._map):
+                self._map.flush()
+                self._map_file(len(self._map) + GROW_RECORDS * RECORD.size)
+            RECORD.pack_into(self._map, offset, *fields)
+            self.count += 1
+            struct.pack_into("<Q", self._map, COUNT_OFFSET, self.count)
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval:
+                self._map.flush()
+                self._last_flush = now
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+                self._map.close()
+                self._map = None
+            self._file.close()
+
+
+class JournalReader:
+    """Read-only view of a journal that never loads the whole file.
+
+    Records are unpacked from the mapping on access, so opening a multi-GB
+    journal is instant and at_time() only touches the pages its binary
+    search lands on. Records are in timestamp order because they are
+    appended as the sampler produces them.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.count, self.created = _read_header(self._map)
+        except (ValueError, struct.error):
+            self._file.close()
+            raise JournalError("Not a PulsePC journal") from None
+        except JournalError:
+            self._map.close()
+            self._file.close()
+            raise
+        # Never read past what was mapped, even if the header was updated later
+        self.count = min(self.count, (len(self._map) - HEADER_SIZE) // RECORD.size)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("journal index out of range")
+        return unpack_record(self._map, HEADER_SIZE + index * RECORD.size)
+
+    def timestamp(self, index):
+        return struct.unpack_from("<d", self._map, HEADER_SIZE + index * RECORD.size)[0]
+
+    def at_time(self, timestamp):
+        """Index of the first record taken at or after timestamp"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamp(middle) < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def between(self, start, end):
+        """Yield the records taken from start up to (not including) end"""
+        for index in range(self.at_time(start), self.count):
+            record = self[index]
+            if record.timestamp >= end:
+                break
+            yield record
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
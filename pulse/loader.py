@@ -0,0 +1,116 @@
+import queue
+
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pythoncom
+    PYTHONCOM_AVAILABLE = True
+except ImportError:
+    PYTHONCOM_AVAILABLE = False
+
+
+def init_worker():
+    """Per-thread setup for loader workers (COM must be initialized per thread)"""
+    if PYTHONCOM_AVAILABLE:
+        try:
+            pythoncom.CoInitialize()
+        except Exception:
+            pass
+
+
+class PageLoader:
+    """Run collectors on worker threads and deliver the results on the Tk thread.
+
+    Tk widgets may only be touched from the thread running mainloop, so workers
+    push finished futures onto a queue that is drained with root.after while
+    any job is outstanding. Nothing is polled while the loader is idle.
+    """
+
+    def __init__(self, root, max_workers=4, poll_ms=30):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="pulse-loader",
+                                           initializer=init_worker)
+        self._done = queue.Queue()
+        self._outstanding = 0
+        self._polling = False
+        self._generation = 0
+        self._running = set()
+
+    def submit(self, collector, callback, errback=None):
+        """Run collector() in a worker, then callback(result) on the Tk thread"""
+        future = self.executor.submit(collector)
+        self._outstanding += 1
+        future.add_done_callback(lambda f: self._done.put((f, callback, errback)))
+        self._schedule_drain()
+        return future
+
+    def submit_once(self, key, collector, callback, errback=None):
+        """Like submit, but skip the job if one with the same key is still running"""
+        if key in self._running:
+            return None
+        self._running.add(key)
+
+        def finish(result):
+            self._running.discard(key)
+            callback(result)
+
+        def fail(error):
+            self._running.discard(key)
+            if errback:
+                errback(error)
+            else:
+                print(f"Error collecting {key}:", error)
+
+        return self.submit(collector, finish, fail)
+
+    def load(self, page, collector, callback):
+        """Collect data for a page; the result is dropped if another page was
+        requested before it arrived."""
+        self._generation += 1
+        generation = self._generation
+
+        def deliver(result):
+            if generation == self._generation:
+                callback(result)
+
+        def fail(error):
+            print(f"Error loading {page} page:", error)
+
+        return self.submit(collector, deliver, fail)
+
+    def cancel_pages(self):
+        """Mark every in-flight page load as stale"""
+        self._generation += 1
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
+
+    def _schedule_drain(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._drain)
+
+    def _drain(self):
+        while True:
+            try:
+                future, callback, errback = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            try:
+                error = future.exception()
+                if error is None:
+                    callback(future.result())
+                elif errback:
+                    errback(error)
+                else:
+                    print("Background job failed:", error)
+            except Exception as e:
+                print("Error delivering background result:", e)
+
+        if self._outstanding > 0:
+            self.root.after(self.poll_ms, self._drain)
+        else:
+            self._polling = False
@@ -0,0 +1,103 @@
+import heapq
+import threading
+import time
+
+import psutil
+
+# Open handles are a Windows notion; file descriptors are the closest thing elsewhere
+HANDLES_ATTRIBUTE = "num_handles" if hasattr(psutil.Process, "num_handles") else "num_fds"
+# The name is only read the first time a process is seen
+PROCESS_ATTRIBUTES = ["pid", "create_time", "cpu_times", "memory_info", "num_threads",
+                      "io_counters", HANDLES_ATTRIBUTE]
+
+# Column -> ProcessRow attribute used to sort by it
+SORT_KEYS = {
+    "CPU": "cpu_percent",
+    "Memory": "rss",
+    "I/O": "io_rate",
+    "Threads": "threads",
+    "Handles": "handles",
+}
+
+
+class ProcessRow:
+    """One process as of the last scan; rates are None on its first scan"""
+    __slots__ = ("pid", "name", "cpu_percent", "rss", "io_rate", "threads", "handles")
+
+    def __init__(self, pid, name, cpu_percent, rss, io_rate, threads, handles):
+        self.pid = pid
+        self.name = name
+        self.cpu_percent = cpu_percent
+        self.rss = rss
+        self.io_rate = io_rate
+        self.threads = threads
+        self.handles = handles
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class ProcessScanner:
+    """Scan every process with one process_iter() pass per refresh.
+
+    process_iter() reuses its Process objects between calls and reads the
+    requested attributes under oneshot(), so each process costs a few
+    reads. The scanner keeps the previous CPU time and I/O byte counters of
+    every pid and turns them into rates, instead of sleeping in
+    cpu_percent(interval) per process, and remembers each process's name.
+    """
+
+    def __init__(self):
+        self._previous = {}  # pid -> (create_time, monotonic, cpu seconds, io bytes, name)
+        self._lock = threading.Lock()
+
+    def scan(self):
+        with self._lock:
+            return self._scan()
+
+    def _scan(self):
+        now = time.monotonic()
+        previous = self._previous
+        current = {}
+        rows = []
+        for process in psutil.process_iter(PROCESS_ATTRIBUTES, ad_value=None):
+            info = process.info
+            pid = info["pid"]
+            cpu_times = info["cpu_times"]
+            cpu_seconds = cpu_times.user + cpu_times.system if cpu_times else None
+            io = info["io_counters"]
+            io_bytes = io.read_bytes + io.write_bytes if io else None
+
+            cpu_percent = io_rate = None
+            before = previous.get(pid)
+            # A recycled pid has a different create time and starts over
+            if before is None or before[0] != info["create_time"]:
+                before = None
+                try:
+                    name = process.name()
+                except psutil.Error:
+                    name = None
+            else:
+                name = before[4]
+            current[pid] = (info["create_time"], now, cpu_seconds, io_bytes, name)
+
+            if before is not None:
+                elapsed = now - before[1]
+                if elapsed > 0:
+                    if cpu_seconds is not None and before[2] is not None:
+                        cpu_percent = max(0.0, cpu_seconds - before[2]) / elapsed * 100
+                    if io_bytes is not None and before[3] is not None:
+                        io_rate = max(0, io_bytes - before[3]) / elapsed
+
+            memory = info["memory_info"]
+            rows.append(ProcessRow(pid, name or "?", cpu_percent, memory.rss if memory else None,
+                                   io_rate, info["num_threads"], info[HANDLES_ATTRIBUTE]))
+        # Exited processes simply drop out here
+        self._previous = current
+        return rows
+
+
+def top_processes(rows, column="CPU", count=200):
+    """The `count` rows with the highest value in the given column, highest first"""
+    attribute = SORT_KEYS[column]
+    return heapq.nlargest(count, rows, key=lambda row: getattr(row, attribute) or 0)
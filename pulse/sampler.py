@@ -0,0 +1,283 @@
+import itertools
+import sys
+import threading
+import time
+
+from collections import Counter, namedtuple
+from dataclasses import dataclass
+
+import psutil
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Immutable set of readings taken by the sampler at one instant.
+
+    Rates are computed from the delta against the previous sample, so they are
+    None on the very first snapshot. Optional fields are None while nobody
+    is subscribed to them.
+    """
+    timestamp: float
+    cpu_percent: object
+    memory: object
+    per_cpu: object = None
+    disk_read_rate: object = None
+    disk_write_rate: object = None
+    net_sent_rate: object = None
+    net_recv_rate: object = None
+    disks: object = None
+    nics: object = None
+    process_count: object = None
+    boot_time: object = None
+
+
+# Snapshot fields that are only read while something is subscribed to them
+OPTIONAL_FIELDS = ("disks", "nics", "process_count")
+
+
+def cpu_busy_total(times):
+    """Return (busy, total) seconds for a psutil cpu_times() tuple"""
+    total = sum(times)
+    # guest time is already accounted in user/nice on Linux
+    total -= getattr(times, "guest", 0) + getattr(times, "guest_nice", 0)
+    busy = total - times.idle - getattr(times, "iowait", 0)
+    return busy, total
+
+
+def times_matrix(times):
+    """percpu cpu_times() as a (cpus, fields) float array"""
+    width = len(times[0])
+    return numpy.fromiter(itertools.chain.from_iterable(times), float, len(times) * width).reshape(-1, width)
+
+
+def cpu_percents(previous, current):
+    """(total, [per logical CPU]) utilisation between two percpu cpu_times() readings.
+
+    All CPUs are handled in one vectorized step when NumPy is installed.
+    Returns (None, None) if the number of CPUs changed in between.
+    """
+    if len(previous) != len(current) or not current:
+        return None, None
+    if not NUMPY_AVAILABLE:
+        per_cpu = []
+        busy = total = 0.0
+        for before, now in zip(previous, current):
+            busy_before, total_before = cpu_busy_total(before)
+            busy_now, total_now = cpu_busy_total(now)
+            core_busy, core_total = busy_now - busy_before, total_now - total_before
+            per_cpu.append(min(100.0, max(0.0, core_busy / core_total * 100)) if core_total > 0 else 0.0)
+            busy += core_busy
+            total += core_total
+        return (min(100.0, max(0.0, busy / total * 100)) if total > 0 else 0.0), per_cpu
+
+    fields = current[0]._fields
+    idle_columns = [fields.index(name) for name in ("idle", "iowait") if name in fields]
+    guest_columns = [fields.index(name) for name in ("guest", "guest_nice") if name in fields]
+    delta = times_matrix(current) - times_matrix(previous)
+    total = delta.sum(axis=1) - delta[:, guest_columns].sum(axis=1)
+    busy = total - delta[:, idle_columns].sum(axis=1)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        per_cpu = numpy.where(total > 0, busy / total * 100, 0.0).clip(0.0, 100.0)
+    overall = total.sum()
+    return (float(min(100.0, max(0.0, busy.sum() / overall * 100))) if overall > 0 else 0.0), per_cpu.tolist()
+
+
+def rate(previous, current, elapsed):
+    """Per-second rate of a monotonically increasing counter"""
+    if previous is None or current is None or elapsed <= 0:
+        return None
+    return max(0, current - previous) / elapsed
+
+
+# Latency is the average milliseconds spent per completed request; busy is
+# None where the platform has no busy_time counter
+DiskRates = namedtuple("DiskRates", "read_rate write_rate read_iops write_iops latency busy_percent")
+
+
+# Utilization is the busier direction against the link speed, None when the
+# speed is unknown
+NicRates = namedtuple("NicRates", "sent_rate recv_rate packets_sent_rate packets_recv_rate "
+                                  "error_rate drop_rate utilization")
+
+
+def nic_rates(previous, current, elapsed, speeds):
+    """{interface: NicRates} between two net_io_counters(pernic=True) readings.
+
+    `speeds` maps interfaces to their link speed in Mbps.
+    """
+    rates = {}
+    if elapsed <= 0:
+        return rates
+    for name, now in current.items():
+        before = previous.get(name)
+        if before is None:
+            continue
+        sent = rate(before.bytes_sent, now.bytes_sent, elapsed)
+        received = rate(before.bytes_recv, now.bytes_recv, elapsed)
+        speed = speeds.get(name)
+        rates[name] = NicRates(
+            sent, received,
+            rate(before.packets_sent, now.packets_sent, elapsed),
+            rate(before.packets_recv, now.packets_recv, elapsed),
+            rate(before.errin + before.errout, now.errin + now.errout, elapsed),
+            rate(before.dropin + before.dropout, now.dropin + now.dropout, elapsed),
+            min(100.0, max(sent, received) * 8 / (speed * 10000)) if speed else None)
+    return rates
+
+
+def disk_rates(previous, current, elapsed):
+    """{disk: DiskRates} between two disk_io_counters(perdisk=True) readings"""
+    rates = {}
+    if elapsed <= 0:
+        return rates
+    for name, now in current.items():
+        before = previous.get(name)
+        if before is None:
+            continue
+        reads = max(0, now.read_count - before.read_count)
+        writes = max(0, now.write_count - before.write_count)
+        io_time = max(0, now.read_time - before.read_time) + max(0, now.write_time - before.write_time)
+        busy = None
+        if hasattr(now, "busy_time"):
+            busy = min(100.0, max(0, now.busy_time - before.busy_time) / (elapsed * 10))
+        rates[name] = DiskRates(rate(before.read_bytes, now.read_bytes, elapsed),
+                                rate(before.write_bytes, now.write_bytes, elapsed),
+                                reads / elapsed, writes / elapsed,
+                                io_time / (reads + writes) if reads + writes else 0.0, busy)
+    return rates
+
+
+class Sampler:
+    """Collect live counters on a background thread.
+
+    The thread takes a reading every `interval` seconds and replaces the
+    published snapshot, so every page and widget shares one set of system
+    calls per tick. Readers only call latest(), which never blocks;
+    listeners are called with every new snapshot on the sampling thread.
+    The OPTIONAL_FIELDS are read only while subscribe() has been called for
+    them more often than unsubscribe().
+    """
+
+    def __init__(self, interval=1.0, link_speed_ttl=30.0):
+        self.interval = interval
+        self.link_speed_ttl = link_speed_ttl
+        self._latest = None
+        self._previous = None
+        self._link_speeds = {}
+        self._link_speeds_until = 0.0
+        self._boot_time = None
+        self._subscriptions = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+        self._listeners = []
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def subscribe(self, *fields):
+        """Start reading optional snapshot fields from the next tick on"""
+        for field in fields:
+            if field not in OPTIONAL_FIELDS:
+                raise ValueError(f"Unknown optional field {field!r}")
+            self._subscriptions[field] += 1
+
+    def unsubscribe(self, *fields):
+        for field in fields:
+            if self._subscriptions[field] > 0:
+                self._subscriptions[field] -= 1
+
+    def subscribed(self, field):
+        return self._subscriptions[field] > 0
+
+    def start(self):
+        """Take a first reading and start the sampling thread (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="pulse-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ask the sampling thread to exit"""
+        self._stop.set()
+
+    def latest(self):
+        """Most recent snapshot, or None before the first reading"""
+        return self._latest
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                print("Sampler error:", e, file=sys.stderr)
+
+    def link_speeds(self, now):
+        """Link speed of every interface in Mbps, re-read every link_speed_ttl seconds"""
+        if now >= self._link_speeds_until:
+            try:
+                self._link_speeds = {name: stats.speed for name, stats in psutil.net_if_stats().items()}
+            except Exception:
+                self._link_speeds = {}
+            self._link_speeds_until = now + self.link_speed_ttl
+        return self._link_speeds
+
+    def sample(self):
+        """Take one reading, publish it and return the new snapshot"""
+        now = time.monotonic()
+        # The total is summed from the per-CPU counters, so one read covers both
+        cpu_times = psutil.cpu_times(percpu=True)
+        memory = psutil.virtual_memory()
+        disk = per_disk = net = per_nic = process_count = None
+        try:
+            disk = psutil.disk_io_counters()
+            if self.subscribed("disks"):
+                per_disk = psutil.disk_io_counters(perdisk=True)
+        except Exception:
+            pass
+        try:
+            net = psutil.net_io_counters()
+            if self.subscribed("nics"):
+                per_nic = psutil.net_io_counters(pernic=True)
+        except Exception:
+            pass
+        if self.subscribed("process_count"):
+            process_count = len(psutil.pids())
+        # Only changes when the clock is set, which is not worth a call per tick
+        if self._boot_time is None:
+            self._boot_time = psutil.boot_time()
+
+        cpu_percent = per_cpu = None
+        rates = {}
+        if self._previous is not None:
+            then, prev_cpu, prev_disk, prev_per_disk, prev_net, prev_per_nic = self._previous
+            elapsed = now - then
+            cpu_percent, per_cpu = cpu_percents(prev_cpu, cpu_times)
+            if disk is not None and prev_disk is not None:
+                rates["disk_read_rate"] = rate(prev_disk.read_bytes, disk.read_bytes, elapsed)
+                rates["disk_write_rate"] = rate(prev_disk.write_bytes, disk.write_bytes, elapsed)
+            if per_disk and prev_per_disk:
+                rates["disks"] = disk_rates(prev_per_disk, per_disk, elapsed)
+            if net is not None and prev_net is not None:
+                rates["net_sent_rate"] = rate(prev_net.bytes_sent, net.bytes_sent, elapsed)
+                rates["net_recv_rate"] = rate(prev_net.bytes_recv, net.bytes_recv, elapsed)
+            if per_nic and prev_per_nic:
+                rates["nics"] = nic_rates(prev_per_nic, per_nic, elapsed, self.link_speeds(now))
+        self._previous = (now, cpu_times, disk, per_disk, net, per_nic)
+
+        snapshot = Snapshot(timestamp=time.time(), cpu_percent=cpu_percent, memory=memory,
+                            per_cpu=per_cpu, process_count=process_count, boot_time=self._boot_time,
+                            **rates)
+        self._latest = snapshot
+        for listener in self._listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                print("Sampler listener error:", e, file=sys.stderr)
+        return snapshot
@@ -0,0 +1,100 @@
+class Task:
+    """One periodic refresh: an optional collect() run on a loader worker and
+    an apply(result) run on the Tk thread"""
+
+    def __init__(self, name, period, apply, collect=None, active=None):
+        self.name = name
+        self.period = period
+        self.apply = apply
+        self.collect = collect
+        self.active = active or (lambda: True)
+        self.timer = None
+
+
+class RefreshScheduler:
+    """Run each refresh task on its own period using root.after timers.
+
+    Periods are stretched while the window is unfocused and much more while it
+    is minimized, and a task whose previous collection is still running skips
+    its tick instead of queueing another one.
+    """
+
+    def __init__(self, root, loader, unfocused_factor=2, hidden_factor=10):
+        self.root = root
+        self.loader = loader
+        self.unfocused_factor = unfocused_factor
+        self.hidden_factor = hidden_factor
+        self.tasks = {}
+        self.running = False
+        self.root.bind("<Map>", self._on_map, add="+")
+
+    def add(self, name, period, apply, collect=None, active=None):
+        task = Task(name, period, apply, collect, active)
+        self.tasks[name] = task
+        if self.running:
+            self._schedule(task, 0)
+        return task
+
+    def start(self):
+        self.running = True
+        for task in self.tasks.values():
+            self._schedule(task, 0)
+
+    def stop(self):
+        self.running = False
+        for task in self.tasks.values():
+            self._cancel(task)
+
+    def run_now(self, *names):
+        """Tick the named tasks (all by default) immediately, e.g. when a page is shown"""
+        if not self.running:
+            return
+        for task in self.tasks.values():
+            if names and task.name not in names:
+                continue
+            self._cancel(task)
+            self._tick(task)
+
+    def _on_map(self, event):
+        # <Map> bound on the root also fires for every child widget shown;
+        # only the window itself being restored warrants a refresh
+        if event.widget is self.root:
+            self.run_now()
+
+    def backoff_factor(self):
+        """How much to stretch periods given the current window state"""
+        try:
+            if self.root.state() in ("iconic", "withdrawn"):
+                return self.hidden_factor
+            if self.root.focus_displayof() is None:
+                return self.unfocused_factor
+        except Exception:
+            pass
+        return 1
+
+    def _tick(self, task):
+        task.timer = None
+        factor = self.backoff_factor()
+        if factor < self.hidden_factor:
+            try:
+                if task.active():
+                    if task.collect is None:
+                        task.apply()
+                    else:
+                        # Returns None without submitting while the last run is busy
+                        self.loader.submit_once(task.name, task.collect, task.apply)
+            except Exception as e:
+                print(f"Error refreshing {task.name}:", e)
+        self._schedule(task, task.period * factor)
+
+    def _schedule(self, task, delay):
+        if self.running:
+            task.timer = self.root.after(int(delay * 1000), self._tick, task)
+
+    def _cancel(self, task):
+        if task.timer is not None:
+            try:
+                self.root.after_cancel(task.timer)
+            except Exception:
+                pass
+            task.timer = None
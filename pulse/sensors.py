@@ -0,0 +1,372 @@
+import os
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+
+# Readings outside this range are treated as bogus
+MIN_CELSIUS = 0
+MAX_CELSIUS = 150
+
+
+def plausible(celsius):
+    return MIN_CELSIUS < celsius < MAX_CELSIUS
+
+
+def decikelvin_to_celsius(value):
+    return (float(value) / 10.0) - 273.15
+
+
+class TemperatureSource:
+    """A way of reading temperatures; read() returns {sensor name: °C}.
+
+    Sources keep whatever they need between reads (handles, queries,
+    processes) and release it in close().
+    """
+    name = "unknown"
+
+    def read(self):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class WMIThermalZoneSource(TemperatureSource):
+    """ACPI thermal zones from root\\wmi"""
+    name = "MSAcpi_ThermalZoneTemperature"
+
+    def __init__(self, wmi_service):
+        self.wmi = wmi_service
+
+    def read(self):
+        readings = {}
+        for zone in self.wmi.query("MSAcpi_ThermalZoneTemperature", ["CurrentTemperature", "InstanceName"],
+                                   namespace="root\\wmi"):
+            if zone.CurrentTemperature:
+                celsius = decikelvin_to_celsius(zone.CurrentTemperature)
+                if plausible(celsius):
+                    readings[f"Thermal Zone {zone.InstanceName}"] = celsius
+        return readings
+
+
+class WMITemperatureProbeSource(TemperatureSource):
+    """Win32_TemperatureProbe, populated by a few OEM providers"""
+    name = "Win32_TemperatureProbe"
+
+    def __init__(self, wmi_service):
+        self.wmi = wmi_service
+
+    def read(self):
+        readings = {}
+        for probe in self.wmi.query("Win32_TemperatureProbe", ["CurrentReading", "DeviceID"]):
+            if probe.CurrentReading:
+                celsius = decikelvin_to_celsius(probe.CurrentReading)
+                if plausible(celsius):
+                    readings[f"Temperature Probe {probe.DeviceID}"] = celsius
+        return readings
+
+
+# hwmon attribute prefix -> (divisor to the display unit, unit)
+HWMON_UNITS = {
+    "temp": (1000.0, "°C"),
+    "fan": (1.0, "RPM"),
+    "in": (1000.0, "V"),
+    "power": (1000000.0, "W"),
+}
+HWMON_ATTRIBUTE = re.compile(r"^(temp|fan|in|power)(\d+)_(input|average)$")
+
+
+class Sensor:
+    """One sysfs value file, kept open for the lifetime of the backend"""
+    __slots__ = ("kind", "label", "unit", "divisor", "path", "fd")
+
+    def __init__(self, kind, label, path):
+        self.kind = kind
+        self.label = label
+        self.divisor, self.unit = HWMON_UNITS[kind]
+        self.path = path
+        self.fd = None
+
+    def format(self, value):
+        if self.kind == "temp":
+            return f"{value:.1f}{self.unit}"
+        if self.kind == "in":
+            return f"{value:.3f} {self.unit}"
+        return f"{value:.0f} {self.unit}" if self.kind == "fan" else f"{value:.1f} {self.unit}"
+
+
+def read_text(path):
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class SysfsSensors:
+    """Linux hwmon and thermal zone sensors.
+
+    Discovery enumerates every temp, fan, voltage (in) and power attribute of
+    each hwmon chip with its label, plus /sys/class/thermal/thermal_zone*.
+    The value files are opened once and read with os.pread, so polling
+    costs one syscall per sensor. The roots can point at a fake tree.
+    """
+
+    def __init__(self, hwmon_root="/sys/class/hwmon", thermal_root="/sys/class/thermal"):
+        self.hwmon_root = hwmon_root
+        self.thermal_root = thermal_root
+        self._sensors = None
+        self._lock = threading.Lock()
+
+    @property
+    def available(self):
+        return os.path.isdir(self.hwmon_root) or os.path.isdir(self.thermal_root)
+
+    def sensors(self):
+        with self._lock:
+            return list(self._ensure_discovered())
+
+    def _ensure_discovered(self):
+        if self._sensors is None:
+            self._sensors = self._discover()
+        return self._sensors
+
+    def _discover(self):
+        sensors = []
+        if os.path.isdir(self.hwmon_root):
+            for hwmon in sorted(os.listdir(self.hwmon_root), key=natural_key):
+                sensors.extend(self._discover_chip(os.path.join(self.hwmon_root, hwmon)))
+        if os.path.isdir(self.thermal_root):
+            for zone in sorted(os.listdir(self.thermal_root), key=natural_key):
+                if not zone.startswith("thermal_zone"):
+                    continue
+                directory = os.path.join(self.thermal_root, zone)
+                zone_type = read_text(os.path.join(directory, "type")) or zone
+                sensors.append(Sensor("temp", f"{zone_type} ({zone})", os.path.join(directory, "temp")))
+
+        opened = []
+        for sensor in sensors:
+            try:
+                sensor.fd = os.open(sensor.path, os.O_RDONLY)
+                opened.append(sensor)
+            except OSError:
+                continue
+        return opened
+
+    def _discover_chip(self, directory):
+        try:
+            entries = os.listdir(directory)
+        except OSError:
+            return []
+        chip = read_text(os.path.join(directory, "name")) or os.path.basename(directory)
+        present = set(entries)
+        sensors = []
+        for entry in sorted(entries, key=natural_key):
+            match = HWMON_ATTRIBUTE.match(entry)
+            if not match:
+                continue
+            kind, index, suffix = match.groups()
+            # Power is exposed as _input or _average depending on the driver
+            if suffix == "average" and f"{kind}{index}_input" in present:
+                continue
+            label = read_text(os.path.join(directory, f"{kind}{index}_label")) or f"{kind}{index}"
+            sensors.append(Sensor(kind, f"{chip} {label}", os.path.join(directory, entry)))
+        return sensors
+
+    def read(self, kinds=None):
+        """Return [(sensor, value)] for every sensor that could be read"""
+        readings = []
+        # Held while reading so close() cannot recycle a descriptor mid-read
+        with self._lock:
+            for sensor in self._ensure_discovered():
+                if kinds and sensor.kind not in kinds:
+                    continue
+                try:
+                    # sysfs regenerates the attribute on every read from offset 0
+                    raw = os.pread(sensor.fd, 32, 0)
+                    readings.append((sensor, int(raw) / sensor.divisor))
+                except (OSError, ValueError):
+                    # Some drivers return EIO/ENODATA for sensors that are idle
+                    continue
+        return readings
+
+    def close(self):
+        with self._lock:
+            for sensor in self._sensors or []:
+                try:
+                    os.close(sensor.fd)
+                except OSError:
+                    pass
+            self._sensors = None
+
+
+def natural_key(name):
+    """Sort key that puts temp2 before temp10"""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+class SysfsTemperatureSource(TemperatureSource):
+    """Temperatures from the sysfs hwmon chips and thermal zones.
+
+    The SysfsSensors backend is shared with the fan and voltage readings, so
+    its owner closes it; close() leaves it open.
+    """
+    name = "sysfs"
+
+    def __init__(self, sysfs):
+        self.sysfs = sysfs
+
+    def read(self):
+        if not self.sysfs.available:
+            return {}
+        return {sensor.label: value for sensor, value in self.sysfs.read(("temp",)) if plausible(value)}
+
+
+class PowerShellSource(TemperatureSource):
+    """Thermal zones through one long-running PowerShell process.
+
+    Used when the wmi package is missing. The process reads commands from
+    stdin, so each reading costs a pipe round-trip instead of starting
+    powershell.exe again. Its output is read on a helper thread so a
+    reading can give up after `timeout` seconds; the process is then killed
+    and the next read starts a new one.
+    """
+    name = "PowerShell"
+    COMMAND = ("Get-CimInstance -Namespace root/wmi -ClassName MSAcpi_ThermalZoneTemperature | "
+               "ForEach-Object { \"$($_.InstanceName)`t$($_.CurrentTemperature)\" }; '##END##'\n")
+
+    def __init__(self, timeout=5.0):
+        self.timeout = timeout
+        self._process = None
+        self._lines = None
+
+    def _start(self):
+        flags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        self._process = subprocess.Popen(
+            ["powershell", "-NoLogo", "-NoProfile", "-NonInteractive", "-Command", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, bufsize=1, creationflags=flags)
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._process.stdout, self._lines),
+                         name="pulse-powershell", daemon=True).start()
+
+    @staticmethod
+    def _pump(stdout, lines):
+        """Forward output lines to the queue; None marks the end of the session"""
+        try:
+            for line in stdout:
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        lines.put(None)
+
+    def read(self):
+        if self._process is None or self._process.poll() is not None:
+            self.close()
+            self._start()
+        try:
+            self._process.stdin.write(self.COMMAND)
+            self._process.stdin.flush()
+        except OSError:
+            self.close()
+            raise
+
+        deadline = time.monotonic() + self.timeout
+        readings = {}
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self.close()
+                raise TimeoutError(f"PowerShell did not answer within {self.timeout} s") from None
+            if line is None:
+                self.close()
+                raise OSError("PowerShell session ended")
+            line = line.strip()
+            if line == "##END##":
+                break
+            _, _, value = line.partition("\t")
+            try:
+                celsius = decikelvin_to_celsius(value)
+            except ValueError:
+                continue
+            if plausible(celsius) and not readings:
+                readings["CPU Temperature"] = celsius
+        return readings
+
+    def close(self):
+        if self._process is not None:
+            try:
+                self._process.kill()
+            except Exception:
+                pass
+            self._process = None
+            self._lines = None
+
+
+class TemperatureProbe:
+    """Pick the first temperature source that works and stick with it.
+
+    Discovery tries every source in order once. Later reads only use the
+    chosen one; discovery runs again when it fails or stops returning data.
+    If nothing works, discovery is retried at most every `retry_after`
+    seconds rather than on every refresh.
+    """
+
+    def __init__(self, sources, retry_after=60.0):
+        self.sources = list(sources)
+        self.retry_after = retry_after
+        self.active = None
+        self._next_discovery = 0.0
+        self._lock = threading.Lock()
+
+    def read(self):
+        with self._lock:
+            if self.active is not None:
+                try:
+                    readings = self.active.read()
+                    if readings:
+                        return readings
+                except Exception:
+                    pass
+                self.active.close()
+                self.active = None
+            return self._discover()
+
+    def _discover(self):
+        now = time.monotonic()
+        if now < self._next_discovery:
+            return {}
+        for source in self.sources:
+            try:
+                readings = source.read()
+            except Exception:
+                readings = None
+            if readings:
+                self.active = source
+                return readings
+            source.close()
+        self._next_discovery = now + self.retry_after
+        return {}
+
+    def close(self):
+        with self._lock:
+            for source in self.sources:
+                source.close()
+            self.active = None
+
+
+def default_sources(wmi_service, sysfs=None):
+    """Temperature sources worth probing on this machine, in order of preference"""
+    sources = []
+    if wmi_service.available:
+        sources.append(WMIThermalZoneSource(wmi_service))
+        sources.append(WMITemperatureProbeSource(wmi_service))
+    elif sys.platform == "win32":
+        # Same thermal zones, reached without the wmi package
+        sources.append(PowerShellSource())
+    sources.append(SysfsTemperatureSource(sysfs or SysfsSensors()))
+    return sources
@@ -0,0 +1,134 @@
+import os
+import re
+import threading
+
+from concurrent.futures import Future, wait
+
+import psutil
+
+from .sensors import read_text
+
+# Interface guessed from the kernel name of a disk without WMI
+SYSFS_INTERFACES = (
+    ("nvme", "NVMe"),
+    ("sd", "SCSI/SATA"),
+    ("vd", "VirtIO"),
+    ("xvd", "Xen"),
+    ("mmcblk", "MMC"),
+    ("hd", "IDE"),
+)
+
+
+def partition_key(device):
+    """Key of a psutil partition device in a partition index: 'C:' or 'sda1'"""
+    if len(device) >= 2 and device[1] == ":":
+        return device[:2].upper()
+    return os.path.basename(device.rstrip("/"))
+
+
+def wmi_reference_id(reference):
+    """DeviceID out of a WMI object path such as Win32_LogicalDisk.DeviceID="C:" """
+    match = re.search(r'DeviceID="((?:[^"\\]|\\.)*)"', reference or "")
+    return match.group(1).replace("\\\\", "\\") if match else None
+
+
+def sysfs_disks(root="/sys/block"):
+    """Physical disks under /sys/block as dicts of name, model, size, serial, state and interface.
+
+    Devices without a backing `device` link (loop, ram, zram, dm) are skipped.
+    """
+    disks = []
+    try:
+        names = sorted(os.listdir(root))
+    except OSError:
+        return disks
+    for name in names:
+        directory = os.path.join(root, name)
+        if not os.path.exists(os.path.join(directory, "device")):
+            continue
+        sectors = read_text(os.path.join(directory, "size"))
+        disks.append({
+            "name": name,
+            "model": read_text(os.path.join(directory, "device", "model")),
+            "size": int(sectors) * 512 if sectors and sectors.isdigit() else None,
+            "serial": read_text(os.path.join(directory, "device", "serial")),
+            "state": read_text(os.path.join(directory, "device", "state")),
+            "interface": next((label for prefix, label in SYSFS_INTERFACES if name.startswith(prefix)), None),
+        })
+    return disks
+
+
+def sysfs_partition_index(root="/sys/block"):
+    """{partition or disk name: disk name} from /sys/block/<disk>/<partition>"""
+    index = {}
+    try:
+        disks = os.listdir(root)
+    except OSError:
+        return index
+    for disk in disks:
+        index[disk] = disk
+        try:
+            entries = os.listdir(os.path.join(root, disk))
+        except OSError:
+            continue
+        for entry in entries:
+            if os.path.exists(os.path.join(root, disk, entry, "partition")):
+                index[entry] = disk
+    return index
+
+
+class DiskUsageProbe:
+    """Query disk_usage() of many mountpoints in parallel, bounded by a timeout.
+
+    Every call runs on its own daemon thread, so a hung network share cannot
+    hold up the queries of healthy mountpoints. At most one call per
+    mountpoint is in flight: while an earlier one is still running, the
+    mountpoint is reported as not responding right away, without waiting
+    on it again or starting another thread.
+    """
+
+    def __init__(self, timeout=2.0):
+        self.timeout = timeout
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def query(self, mountpoints):
+        """Return ({mountpoint: usage}, {mountpoints that timed out}); failures are left out"""
+        futures = {}
+        timed_out = set()
+        with self._lock:
+            for mountpoint in dict.fromkeys(mountpoints):
+                future = self._pending.get(mountpoint)
+                if future is not None and not future.done():
+                    timed_out.add(mountpoint)
+                elif not self._closed:
+                    futures[mountpoint] = self._pending[mountpoint] = self._submit(mountpoint)
+        done, _ = wait(list(futures.values()), timeout=self.timeout)
+
+        usages = {}
+        for mountpoint, future in futures.items():
+            if future not in done:
+                timed_out.add(mountpoint)
+            elif future.exception() is None:
+                usages[mountpoint] = future.result()
+        return usages, timed_out
+
+    @staticmethod
+    def _submit(mountpoint):
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(psutil.disk_usage(mountpoint))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name="pulse-usage", daemon=True).start()
+        return future
+
+    def shutdown(self):
+        # Calls still running are daemon threads and are left to finish
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
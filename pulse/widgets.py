@@ -0,0 +1,378 @@
+from collections import OrderedDict
+
+import customtkinter as ctk
+
+
+class LiveValues:
+    """Widgets that are refreshed in place, looked up by key.
+
+    The last value written to each widget is remembered and Tk is only asked
+    to redraw when the new value is different.
+    """
+
+    def __init__(self):
+        self._widgets = {}
+        self._values = {}
+
+    def bind(self, key, widget):
+        self._widgets[key] = widget
+        self._values.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._widgets
+
+    def clear(self):
+        self._widgets.clear()
+        self._values.clear()
+
+    def set_text(self, key, text):
+        """Show text on a label; returns True if the label was reconfigured"""
+        widget = self._widgets.get(key)
+        if widget is None or self._values.get(key) == text:
+            return False
+        widget.configure(text=text)
+        self._values[key] = text
+        return True
+
+    def set_progress(self, key, fraction):
+        """Move a progress bar, ignoring changes too small to be drawn"""
+        widget = self._widgets.get(key)
+        if widget is None:
+            return False
+        fraction = max(0.0, min(1.0, fraction))
+        previous = self._values.get(key)
+        if previous is not None and abs(previous - fraction) < 0.001:
+            return False
+        widget.set(fraction)
+        self._values[key] = fraction
+        return True
+
+
+class KeyedRows:
+    """A list of label rows inside `parent`, one per key.
+
+    update() receives the full ordered mapping of key -> text each time.
+    Rows for new keys are created, rows whose text changed are reconfigured
+    and rows for keys that disappeared are destroyed; everything else is left
+    untouched.
+    """
+
+    def __init__(self, parent, empty_text=None):
+        self.parent = parent
+        self.empty_text = empty_text
+        self._rows = {}  # key -> (frame, label, text)
+
+    def update(self, items):
+        if not items and self.empty_text:
+            items = {None: self.empty_text}
+
+        for key in [key for key in self._rows if key not in items]:
+            frame, label, text = self._rows.pop(key)
+            frame.destroy()
+
+        for key, text in items.items():
+            row = self._rows.get(key)
+            if row is None:
+                frame = ctk.CTkFrame(self.parent)
+                frame.pack(fill="x", padx=5, pady=2)
+                label = ctk.CTkLabel(frame, text=text, anchor="w")
+                label.pack(fill="x", padx=10, pady=5)
+                self._rows[key] = (frame, label, text)
+            elif row[2] != text:
+                row[1].configure(text=text)
+                self._rows[key] = (row[0], row[1], text)
+
+    def __len__(self):
+        return len(self._rows)
+
+
+class Page:
+    """A built page: its frame, the widgets refreshed in place and the
+    (metric, callback) pairs subscribed while it is on screen"""
+
+    def __init__(self, name, frame):
+        self.name = name
+        self.frame = frame
+        self.widgets = LiveValues()
+        self.views = {}
+        self.subscriptions = []
+        self.built = False
+        self.size = 0
+
+    def measure(self):
+        """Count the widgets in the page, used as its weight in the cache"""
+        pending = [self.frame]
+        count = 0
+        while pending:
+            widget = pending.pop()
+            count += 1
+            pending.extend(widget.winfo_children())
+        self.size = count
+        return count
+
+    def destroy(self):
+        self.widgets.clear()
+        self.views.clear()
+        self.subscriptions.clear()
+        self.frame.destroy()
+
+
+class PageCache:
+    """Pages kept alive between visits, least recently shown evicted first.
+
+    Both the number of pages and their total widget count are capped; the
+    page being shown is never evicted.
+    """
+
+    def __init__(self, max_pages=6, max_widgets=5000):
+        self.max_pages = max_pages
+        self.max_widgets = max_widgets
+        self._pages = OrderedDict()
+
+    def get(self, name):
+        page = self._pages.get(name)
+        if page is not None:
+            self._pages.move_to_end(name)
+        return page
+
+    def add(self, page):
+        self._pages[page.name] = page
+        self._pages.move_to_end(page.name)
+        self.trim()
+        return page
+
+    def remove(self, name):
+        page = self._pages.pop(name, None)
+        if page is not None:
+            page.destroy()
+
+    def trim(self):
+        """Destroy the least recently shown pages until the cache fits its caps"""
+        while len(self._pages) > 1:
+            total = sum(page.size for page in self._pages.values())
+            if len(self._pages) <= self.max_pages and total <= self.max_widgets:
+                break
+            name, page = self._pages.popitem(last=False)
+            page.destroy()
+
+    def __contains__(self, name):
+        return name in self._pages
+
+
+def decimate(values, factor):
+    """Keep the highest value of every `factor` consecutive ones, newest group last"""
+    first = len(values) % factor
+    groups = [values[:first]] if first else []
+    groups.extend(values[i:i + factor] for i in range(first, len(values), factor))
+    return [max(group) for group in groups]
+
+
+class Sparkline:
+    """A live line chart drawn on one canvas, one line item per series.
+
+    The lines are created once and moved with canvas.coords on every plot,
+    and a series holding more samples than the canvas has pixels is reduced
+    to about one point per pixel column before it is drawn. The newest
+    sample is at the right edge and `samples` points fill the full width.
+    """
+    COLORS = ("#1f6aa5", "#2fa572", "#d4a017", "#c0392b", "#8e44ad", "#16a085")
+
+    def __init__(self, parent, series, samples=60, max_value=100.0, width=300, height=80):
+        self.series = list(series)
+        self.samples = samples
+        self.max_value = max_value
+        self.width = width
+        self.height = height
+        self.canvas = ctk.CTkCanvas(parent, width=width, height=height, bg="#1d1e1e", highlightthickness=0)
+        self.canvas.bind("<Configure>", self._resize)
+        self._lines = {}
+        self._visible = {}
+        self._values = {}
+        for i, name in enumerate(self.series):
+            self._lines[name] = self.canvas.create_line(0, 0, 0, 0, fill=self.COLORS[i % len(self.COLORS)],
+                                                        width=2, state="hidden")
+            self._visible[name] = False
+
+    def plot(self, name, values):
+        """Redraw one series from its newest samples, oldest first"""
+        line = self._lines.get(name)
+        if line is None:
+            return
+        values = list(values)[-self.samples:]
+        self._values[name] = values
+        if len(values) < 2:
+            if self._visible[name]:
+                self.canvas.itemconfigure(line, state="hidden")
+                self._visible[name] = False
+            return
+
+        step = (self.width - 1) / max(1, self.samples - 1)
+        factor = int(1 / step) + 1 if step < 1 else 1
+        if factor > 1 and len(values) >= 2 * factor:
+            values = decimate(values, factor)
+            step *= factor
+        usable = self.height - 4
+        right = self.width - 1
+        last = len(values) - 1
+        coords = []
+        for i, value in enumerate(values):
+            fraction = min(1.0, max(0.0, value / self.max_value))
+            coords.append(right - (last - i) * step)
+            coords.append(2 + usable * (1.0 - fraction))
+        self.canvas.coords(line, coords)
+        if not self._visible[name]:
+            self.canvas.itemconfigure(line, state="normal")
+            self._visible[name] = True
+
+    def _resize(self, event):
+        if event.width == self.width and event.height == self.height:
+            return
+        self.width, self.height = event.width, event.height
+        for name, values in self._values.items():
+            self.plot(name, values)
+
+
+def _blend(start, end, fraction):
+    return "#" + "".join(f"{round(a + (b - a) * fraction):02x}" for a, b in zip(start, end))
+
+
+# Cell colours for 0%, 10%, ... 100% usage: slate through amber to red
+HEAT_COLORS = tuple(_blend((0x2b, 0x3a, 0x4a), (0xd4, 0xa0, 0x17), step / 5) if step <= 5 else
+                    _blend((0xd4, 0xa0, 0x17), (0xc0, 0x39, 0x2b), (step - 5) / 5)
+                    for step in range(11))
+
+
+class CoreHeatmap:
+    """Usage of every logical CPU as a grid of coloured cells on one canvas.
+
+    Each core is a rectangle item created once. update() only recolours
+    the cells whose 10% step changed, so even hundreds of cores cost a few
+    canvas calls per tick and no widgets per core.
+    """
+
+    def __init__(self, parent, count, columns=16, cell=20, gap=2):
+        self.count = count
+        columns = max(1, min(columns, count))
+        rows = (count + columns - 1) // columns
+        pitch = cell + gap
+        self.canvas = ctk.CTkCanvas(parent, width=columns * pitch + gap, height=rows * pitch + gap,
+                                    bg="#1d1e1e", highlightthickness=0)
+        self._cells = []
+        for core in range(count):
+            x = gap + (core % columns) * pitch
+            y = gap + (core // columns) * pitch
+            self._cells.append(self.canvas.create_rectangle(x, y, x + cell, y + cell,
+                                                            fill=HEAT_COLORS[0], width=0))
+        self._steps = [0] * count
+
+    def update(self, percents):
+        for core, percent in enumerate(list(percents)[:self.count]):
+            step = int(min(100.0, max(0.0, percent)) // 10)
+            if step != self._steps[core]:
+                self.canvas.itemconfigure(self._cells[core], fill=HEAT_COLORS[step])
+                self._steps[core] = step
+
+
+class VirtualList:
+    """A scrollable list of text rows that only has widgets for the rows in view.
+
+    A fixed number of labels is created once; scrolling or set_items() just
+    changes which slice of the items they show, and only labels whose text
+    changed are reconfigured. Any number of items costs `rows` widgets.
+    """
+
+    def __init__(self, parent, rows=20, font=None, empty_text=""):
+        self.frame = ctk.CTkFrame(parent)
+        self.rows = rows
+        self.empty_text = empty_text
+        self.items = []
+        self.first = 0
+
+        self.scrollbar = ctk.CTkScrollbar(self.frame, command=self._scroll)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=5)
+        body = ctk.CTkFrame(self.frame, fg_color="transparent")
+        body.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+
+        self._labels = []
+        self._shown = []
+        for _ in range(rows):
+            label = ctk.CTkLabel(body, text="", anchor="w", font=font)
+            label.pack(fill="x", padx=5)
+            self._labels.append(label)
+            self._shown.append("")
+        for widget in [self.frame, body] + self._labels:
+            widget.bind("<MouseWheel>", self._wheel)
+            widget.bind("<Button-4>", lambda event: self.scroll_to(self.first - 3))
+            widget.bind("<Button-5>", lambda event: self.scroll_to(self.first + 3))
+
+    def set_items(self, items):
+        self.items = list(items)
+        self.scroll_to(self.first)
+
+    def scroll_to(self, first):
+        self.first = max(0, min(first, len(self.items) - self.rows))
+        self._render()
+
+    def _render(self):
+        for row, label in enumerate(self._labels):
+            index = self.first + row
+            if index < len(self.items):
+                text = self.items[index]
+            else:
+                text = self.empty_text if row == 0 and not self.items else ""
+            if self._shown[row] != text:
+                label.configure(text=text)
+                self._shown[row] = text
+        total = max(len(self.items), 1)
+        self.scrollbar.set(self.first / total, min(1.0, (self.first + self.rows) / total))
+
+    def _scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.items)))
+        elif action == "scroll":
+            step = self.rows if unit == "pages" else 1
+            self.scroll_to(self.first + int(amount) * step)
+
+    def _wheel(self, event):
+        self.scroll_to(self.first - (3 if event.delta > 0 else -3))
+
+
+class GroupedList(VirtualList):
+    """A VirtualList of collapsible groups, each a header row followed by its entries.
+
+    Clicking a header folds or unfolds its group; the rows are still only
+    the `rows` labels of the underlying list.
+    """
+
+    def __init__(self, parent, rows=20, font=None, empty_text=""):
+        super().__init__(parent, rows=rows, font=font, empty_text=empty_text)
+        self.groups = {}
+        self.collapsed = set()
+        self._headers = []  # group name of each header item, None for entries
+        for row, label in enumerate(self._labels):
+            label.bind("<Button-1>", lambda event, row=row: self.toggle(self.first + row))
+
+    def set_groups(self, groups):
+        """Show an ordered mapping of group name -> list of entry texts"""
+        self.groups = groups
+        self._rebuild()
+
+    def toggle(self, index):
+        if index < len(self._headers) and self._headers[index] is not None:
+            self.collapsed ^= {self._headers[index]}
+            self._rebuild()
+
+    def _rebuild(self):
+        items = []
+        headers = []
+        for name, entries in self.groups.items():
+            if not entries:
+                continue
+            folded = name in self.collapsed
+            items.append(f"{'▸' if folded else '▾'} {name} ({len(entries)})")
+            headers.append(name)
+            if not folded:
+                items.extend(f"      {entry}" for entry in entries)
+                headers.extend([None] * len(entries))
+        self._headers = headers
+        self.set_items(items)
@@ -0,0 +1,182 @@
+import re
+import threading
+
+try:
+    import wmi
+    WMI_AVAILABLE = True
+except ImportError:
+    WMI_AVAILABLE = False
+try:
+    import pythoncom
+    PYTHONCOM_AVAILABLE = True
+except ImportError:
+    PYTHONCOM_AVAILABLE = False
+
+DEFAULT_NAMESPACE = "root\\cimv2"
+
+# ExecQuery flags: return an enumerator at once and do not keep a rewindable copy
+WBEM_FLAG_RETURN_IMMEDIATELY = 0x10
+WBEM_FLAG_FORWARD_ONLY = 0x20
+
+
+class WMIError(Exception):
+    """A WMI query could not be executed"""
+
+
+class WMIRecord:
+    """Plain copy of the properties selected from one WMI object.
+
+    Records hold ordinary Python values, so unlike the COM objects they came
+    from they can be passed between threads and cached.
+    """
+    __slots__ = ("_values",)
+
+    def __init__(self, values):
+        self._values = values
+
+    def __getattr__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(f"{name} was not selected in this query") from None
+
+    def __repr__(self):
+        return f"WMIRecord({self._values!r})"
+
+    def as_dict(self):
+        return dict(self._values)
+
+
+def build_query(wmi_class, fields, where=None):
+    """Build a projected WQL SELECT for the given class and properties"""
+    query = f"SELECT {', '.join(fields)} FROM {wmi_class}"
+    if where:
+        query += f" WHERE {where}"
+    return query
+
+
+class WindowsBackend:
+    """Runs queries through the wmi package on a COM-initialized thread"""
+
+    def connect(self, namespace):
+        if PYTHONCOM_AVAILABLE:
+            pythoncom.CoInitialize()
+        return wmi.WMI(namespace=namespace)
+
+    def execute(self, connection, queries):
+        # Start every query before reading any result, so the providers work
+        # on all of them while the first enumerator is drained
+        pending = [connection._namespace.ExecQuery(query, "WQL",
+                                                   WBEM_FLAG_RETURN_IMMEDIATELY | WBEM_FLAG_FORWARD_ONLY)
+                   for query, fields in queries]
+        results = []
+        for objects, (query, fields) in zip(pending, queries):
+            results.append([{field: self._property(obj, field) for field in fields} for obj in objects])
+        return results
+
+    @staticmethod
+    def _property(obj, field):
+        try:
+            return obj.Properties_(field).Value
+        except Exception:
+            return None
+
+
+class FakeBackend:
+    """In-memory stand-in for WMI so collectors can run without Windows.
+
+    `tables` maps class names to lists of property dicts. Only the selected
+    properties are returned and simple `Prop = 'value'` conditions joined by
+    AND are honoured. Executed WQL is kept in `queries` for inspection.
+    """
+
+    def __init__(self, tables=None):
+        self.tables = tables or {}
+        self.queries = []
+        self.connections = 0
+
+    def connect(self, namespace):
+        self.connections += 1
+        return namespace
+
+    def execute(self, connection, queries):
+        results = []
+        for query, fields in queries:
+            self.queries.append(query)
+            results.append(self._run(query, fields))
+        return results
+
+    def _run(self, query, fields):
+        match = re.match(r"SELECT .+? FROM (\w+)(?: WHERE (.+))?$", query, re.IGNORECASE)
+        if not match:
+            raise WMIError(f"Unsupported query: {query}")
+        wmi_class, where = match.groups()
+        conditions = []
+        if where:
+            for clause in re.split(r"\s+AND\s+", where, flags=re.IGNORECASE):
+                condition = re.match(r"(\w+)\s*=\s*'([^']*)'$", clause.strip())
+                if not condition:
+                    raise WMIError(f"Unsupported condition: {clause}")
+                conditions.append(condition.groups())
+        rows = [row for row in self.tables.get(wmi_class, [])
+                if all(str(row.get(name)) == value for name, value in conditions)]
+        return [{field: row.get(field) for field in fields} for row in rows]
+
+
+class WMIService:
+    """Shared entry point for every WMI query made by the collectors.
+
+    Queries select only the properties the caller reads, several classes can
+    be fetched in one call, and each thread gets its own connection because
+    COM objects cannot be shared between apartments.
+    """
+
+    def __init__(self, backend=None):
+        if backend is None and WMI_AVAILABLE:
+            backend = WindowsBackend()
+        self.backend = backend
+        self._local = threading.local()
+
+    @property
+    def available(self):
+        return self.backend is not None
+
+    def connection(self, namespace=DEFAULT_NAMESPACE):
+        """Connection for the calling thread, created on first use"""
+        connections = self._local.__dict__.setdefault("connections", {})
+        if namespace not in connections:
+            try:
+                connections[namespace] = self.backend.connect(namespace)
+            except Exception as e:
+                raise WMIError(f"Could not connect to {namespace}: {e}") from e
+        return connections[namespace]
+
+    def query(self, wmi_class, fields, where=None, namespace=DEFAULT_NAMESPACE):
+        """Return the selected properties of every instance of wmi_class"""
+        return self.query_many({wmi_class: (wmi_class, fields, where)}, namespace)[wmi_class]
+
+    def query_many(self, requests, namespace=DEFAULT_NAMESPACE):
+        """Run several projected queries in one round-trip.
+
+        `requests` maps a result name to (class, fields) or (class, fields,
+        where); the result maps the same names to lists of WMIRecord.
+        """
+        if not self.available:
+            return {name: [] for name in requests}
+
+        names = list(requests)
+        queries = []
+        for name in names:
+            wmi_class, fields, *rest = requests[name]
+            queries.append((build_query(wmi_class, fields, rest[0] if rest else None), list(fields)))
+
+        connection = self.connection(namespace)
+        try:
+            results = self.backend.execute(connection, queries)
+        except WMIError:
+            raise
+        except Exception as e:
+            # A broken connection is dropped so the next query reconnects
+            self._local.connections.pop(namespace, None)
+            raise WMIError(str(e)) from e
+        return {name: [WMIRecord(values) for values in rows] for name, rows in zip(names, results)}